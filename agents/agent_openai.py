@@ -6,23 +6,57 @@ and returns the response.
 """
 
 import os
+import asyncio
+import contextvars
+import secrets
+from collections import deque
 from typing import TypedDict, Annotated
 from dotenv import load_dotenv
 
 from langchain_core.messages import HumanMessage, AIMessage
-from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph, END, START
 from langgraph.graph.message import add_messages
-from langgraph.checkpoint.memory import MemorySaver
+try:
+    from agents.checkpointer import LightMemorySaver
+    from agents.response_cache import ResponseCache
+except ImportError:
+    # Allow running this file directly: python agents/agent_openai.py
+    from checkpointer import LightMemorySaver
+    from response_cache import ResponseCache
 
 # Load environment variables
 load_dotenv()
 
+# Commands that end the interactive loop
+_EXIT_CMDS = frozenset({"quit", "exit"})
+
+# Maximum messages retained per conversation thread on the direct path
+HISTORY_MAXLEN = 20
+
+# Sliding window of history messages actually sent to the model per turn.
+# Without a cap, turn N sends all N prior messages - quadratic total token
+# spend over a conversation.
+HISTORY_WINDOW = int(os.getenv("HISTORY_WINDOW", "10"))
+
+# Process-wide LLM client cache, keyed by model name. Each ChatOpenAI
+# construction builds an httpx client and TLS pool, so agent instances
+# with the same configuration share one client.
+_LLM_CLIENTS = {}
+
 # Define the state schema
 class AgentState(TypedDict):
     messages: Annotated[list, add_messages]
 
+# Routes the shared graph node to the agent instance that issued the call
+_ACTIVE_AGENT = contextvars.ContextVar("active_openai_agent")
+
+def _agent_node(state: AgentState):
+    """Shared graph node - dispatches to the active agent's _call_model."""
+    return _ACTIVE_AGENT.get()._call_model(state)
+
 class OpenAIAgent:
+    # Class-level graph topology, built once on first instantiation
+    _graph_template = None
     def __init__(self):
         """Initialize the OpenAI agent with API configuration."""
         self.api_key = os.getenv("OPENAI_API_KEY")
@@ -31,44 +65,79 @@ class OpenAIAgent:
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
         
-        # Initialize the OpenAI model
-        self.llm = ChatOpenAI(
-            model=self.model_name,
-            temperature=0.7,
-            max_tokens=1000,
-            openai_api_key=self.api_key
-        )
+        # Initialize the OpenAI model, reusing a shared client when one
+        # already exists for this configuration
+        client_key = (self.model_name,)
+        if client_key not in _LLM_CLIENTS:
+            # Import here rather than at module top: langchain_openai pulls in
+            # the openai client and a large dependency graph, so only pay that
+            # cost when an OpenAI agent is actually constructed
+            from langchain_openai import ChatOpenAI
+
+            _LLM_CLIENTS[client_key] = ChatOpenAI(
+                model=self.model_name,
+                temperature=0.7,
+                max_tokens=1000,
+                openai_api_key=self.api_key
+            )
+        self.llm = _LLM_CLIENTS[client_key]
         
-        # Create the graph
-        self.graph = self._create_graph()
+        # Disk-backed response cache to skip redundant provider calls
+        self.response_cache = ResponseCache()
+
+        # The single-node graph adds state-merge and checkpointer overhead
+        # with no routing benefit, so the default path calls the LLM directly
+        # with a plain per-thread history. Set ENABLE_LANGGRAPH=1 to keep the
+        # graph machinery (e.g. when extending with conditional edges).
+        self.use_langgraph = os.getenv("ENABLE_LANGGRAPH", "0") == "1"
+        self.graph = self._create_graph() if self.use_langgraph else None
+
+        # Per-thread conversation history for the direct path (bounded)
+        self._histories = {}
     
+    @classmethod
+    def _get_graph_template(cls):
+        """Build the constant two-edge topology once per class."""
+        if cls._graph_template is None:
+            workflow = StateGraph(AgentState)
+
+            # Add the agent node (shared dispatcher, not a bound method)
+            workflow.add_node("agent", _agent_node)
+
+            # Set entry point
+            workflow.add_edge(START, "agent")
+            workflow.add_edge("agent", END)
+
+            cls._graph_template = workflow
+        return cls._graph_template
+
     def _create_graph(self):
-        """Create the LangGraph state graph."""
-        # Create the state graph
-        workflow = StateGraph(AgentState)
-        
-        # Add the agent node
-        workflow.add_node("agent", self._call_model)
-        
-        # Set entry point
-        workflow.add_edge(START, "agent")
-        workflow.add_edge("agent", END)
-        
-        # Compile the graph with memory
-        memory = MemorySaver()
-        graph = workflow.compile(checkpointer=memory)
-        
-        return graph
+        """Compile the shared graph template with this agent's memory."""
+        # Only the compile step (which binds the checkpointer) is per-instance
+        memory = LightMemorySaver()
+        return self._get_graph_template().compile(checkpointer=memory)
     
     def _call_model(self, state: AgentState):
         """Call the OpenAI model with the current state."""
         try:
-            # Get the messages from the state
-            messages = state["messages"]
-            
+            # Get the messages from the state, capped to the sliding window
+            messages = list(state["messages"])[-HISTORY_WINDOW:]
+
+            # Short-circuit on a cached response for an identical request
+            cache_key = ResponseCache.make_key(
+                self.model_name, messages, params="temperature=0.7,max_tokens=1000"
+            )
+            cached_content = self.response_cache.get(cache_key)
+            if cached_content is not None:
+                return {"messages": [AIMessage(content=cached_content)]}
+
             # Call the model
             response = self.llm.invoke(messages)
-            
+
+            # Store the response for future identical requests
+            if isinstance(response.content, str):
+                self.response_cache.set(cache_key, response.content)
+
             # Return the response
             return {"messages": [response]}
             
@@ -76,6 +145,10 @@ class OpenAIAgent:
             error_message = AIMessage(content=f"Error calling OpenAI model: {str(e)}")
             return {"messages": [error_message]}
     
+    def _history(self, thread_id: str) -> deque:
+        """Get (or create) the bounded history deque for a thread."""
+        return self._histories.setdefault(thread_id, deque(maxlen=HISTORY_MAXLEN))
+
     def chat(self, user_input: str, thread_id: str = "default"):
         """
         Process user input and return model response.
@@ -90,16 +163,26 @@ class OpenAIAgent:
         try:
             # Create the input message
             input_message = HumanMessage(content=user_input)
-            
-            # Create the config with thread ID for memory
-            config = {"configurable": {"thread_id": thread_id}}
-            
-            # Invoke the graph
-            result = self.graph.invoke(
-                {"messages": [input_message]}, 
-                config=config
-            )
-            
+
+            if self.use_langgraph:
+                # Create the config with thread ID for memory
+                config = {"configurable": {"thread_id": thread_id}}
+
+                # Invoke the graph (route the shared node to this instance)
+                _ACTIVE_AGENT.set(self)
+                result = self.graph.invoke(
+                    {"messages": [input_message]},
+                    config=config
+                )
+            else:
+                # Direct path: plain history append + model call, skipping
+                # the graph's state merge and checkpointer write
+                history = self._history(thread_id)
+                history.append(input_message)
+                result = self._call_model({"messages": list(history)})
+                if result["messages"]:
+                    history.append(result["messages"][-1])
+
             # Extract and return the response
             if result["messages"]:
                 last_message = result["messages"][-1]
@@ -113,6 +196,126 @@ class OpenAIAgent:
         except Exception as e:
             return f"Error processing request: {str(e)}"
 
+    def chat_oneshot(self, user_input: str) -> str:
+        """
+        Process a single stateless input, bypassing the graph.
+
+        Skips the StateGraph traversal, message-reducer merge, and
+        checkpointer write - use this for one-off calls that don't
+        need conversation memory.
+
+        Args:
+            user_input: The user's text input
+
+        Returns:
+            str: The model's response
+        """
+        try:
+            response = self.llm.invoke([HumanMessage(content=user_input)])
+            return response.content
+        except Exception as e:
+            return f"Error processing request: {str(e)}"
+
+    async def astream_chat(self, user_input: str, thread_id: str = "default"):
+        """
+        Stream the model's response token by token.
+
+        Yields tokens as they arrive, so callers see output at first-token
+        latency instead of waiting for the full completion.
+
+        Args:
+            user_input: The user's text input
+            thread_id: Conversation thread ID for memory
+
+        Yields:
+            str: Response text chunks as they arrive
+        """
+        input_message = HumanMessage(content=user_input)
+
+        if not self.use_langgraph:
+            # Direct path: stream straight from the model
+            history = self._history(thread_id)
+            history.append(input_message)
+            collected = []
+            async for chunk in self.llm.astream(list(history)):
+                if chunk.content:
+                    collected.append(chunk.content)
+                    yield chunk.content
+            history.append(AIMessage(content="".join(collected)))
+            return
+
+        config = {"configurable": {"thread_id": thread_id}}
+
+        _ACTIVE_AGENT.set(self)
+        async for event in self.graph.astream_events(
+            {"messages": [input_message]}, config=config, version="v2"
+        ):
+            if event["event"] == "on_chat_model_stream":
+                content = event["data"]["chunk"].content
+                if content:
+                    yield content
+
+    async def achat_batch(self, user_inputs: list, thread_ids: list = None, max_concurrency: int = 10):
+        """
+        Process a batch of user inputs concurrently.
+
+        Dispatches all prompts at once via the graph's abatch with an
+        explicit max_concurrency, so N inputs cost roughly one round trip
+        instead of N sequential ones.
+
+        Args:
+            user_inputs: List of user input strings
+            thread_ids: Optional list of thread IDs (one per input).
+                        Defaults to a distinct thread per input.
+            max_concurrency: Maximum number of concurrent model calls
+
+        Returns:
+            list: Model responses, in input order
+        """
+        if thread_ids is None:
+            thread_ids = [f"batch_{i}" for i in range(len(user_inputs))]
+
+        if not self.use_langgraph:
+            # Direct path: batch straight against the model
+            histories = []
+            payloads = []
+            for text, thread_id in zip(user_inputs, thread_ids):
+                history = self._history(thread_id)
+                history.append(HumanMessage(content=text))
+                histories.append(history)
+                payloads.append(list(history))
+
+            results = await self.llm.abatch(
+                payloads, config={"max_concurrency": max_concurrency}
+            )
+
+            responses = []
+            for history, response in zip(histories, results):
+                history.append(response)
+                responses.append(response.content)
+            return responses
+
+        payloads = [{"messages": [HumanMessage(content=text)]} for text in user_inputs]
+        configs = [
+            {"max_concurrency": max_concurrency, "configurable": {"thread_id": thread_id}}
+            for thread_id in thread_ids
+        ]
+
+        _ACTIVE_AGENT.set(self)
+        results = await self.graph.abatch(payloads, config=configs)
+
+        responses = []
+        for result in results:
+            if result["messages"]:
+                last_message = result["messages"][-1]
+                if hasattr(last_message, 'content'):
+                    responses.append(last_message.content)
+                else:
+                    responses.append(str(last_message))
+            else:
+                responses.append("No response generated.")
+        return responses
+
 def main():
     """Main function to run the interactive chat."""
     print("🤖 Simple LangGraph + OpenAI Agent")
@@ -141,13 +344,13 @@ def main():
             user_input = input("You: ").strip()
             
             # Check for exit commands
-            if user_input.lower() in ['quit', 'exit']:
+            if user_input.lower() in _EXIT_CMDS:
                 print("👋 Goodbye!")
                 break
             
             # Check for clear command
             if user_input.lower() == 'clear':
-                thread_id = f"conversation_{hash(str(os.urandom(8)))}"
+                thread_id = f"conversation_{secrets.token_hex(8)}"
                 print("🗑️ Conversation history cleared.")
                 continue
             
@@ -155,12 +358,15 @@ def main():
             if not user_input:
                 continue
             
-            # Get agent response
-            print("🤔 Thinking...")
-            response = agent.chat(user_input, thread_id)
-            
-            # Print the response
-            print(f"🤖 Agent: {response}")
+            # Stream the agent response token by token
+            print("🤖 Agent: ", end="", flush=True)
+
+            async def _stream_response():
+                async for token in agent.astream_chat(user_input, thread_id):
+                    print(token, end="", flush=True)
+
+            asyncio.run(_stream_response())
+            print()
             print()
             
         except KeyboardInterrupt:
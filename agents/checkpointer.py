@@ -0,0 +1,114 @@
+"""
+Light In-Memory Checkpointer for LangGraph Agents
+
+MemorySaver deep-copies and reconstructs full state on every get/put, which
+adds tens of milliseconds of Python-side overhead per chat() call. This
+checkpointer keeps only the latest checkpoint per thread in a plain dict,
+skipping the copying and version bookkeeping the agents never use.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+
+# orjson serializes message-heavy payloads 2-5x faster than stdlib json;
+# fall back to stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_message(obj: Any) -> Dict[str, Any]:
+    """Encode LangChain message objects as plain dicts for serialization."""
+    if hasattr(obj, "type") and hasattr(obj, "content"):
+        return {"type": obj.type, "content": obj.content}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FastSerde:
+    """JSON serializer for checkpoint payloads, orjson-backed when available."""
+
+    def dumps(self, obj: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(obj, default=_encode_message)
+        return json.dumps(obj, default=_encode_message).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def dumps_typed(self, obj: Any) -> tuple:
+        return "json", self.dumps(obj)
+
+    def loads_typed(self, data: tuple) -> Any:
+        return self.loads(data[1])
+
+
+class LightMemorySaver(BaseCheckpointSaver):
+    """
+    Minimal in-memory checkpointer keyed by thread_id.
+
+    Stores a single latest checkpoint per thread without deep-copying, so
+    get_tuple/put are dict lookups instead of full state reconstruction.
+    Suitable for the single-node conversation graphs used by the agents;
+    it does not keep checkpoint history.
+    """
+
+    def __init__(self):
+        super().__init__(serde=FastSerde())
+        self._store: Dict[str, CheckpointTuple] = {}
+
+    def get_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
+        """Return the latest checkpoint tuple for the thread, if any."""
+        thread_id = config["configurable"]["thread_id"]
+        return self._store.get(thread_id)
+
+    def put(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Store the checkpoint as the thread's latest, replacing any previous one."""
+        thread_id = config["configurable"]["thread_id"]
+        next_config = {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": config["configurable"].get("checkpoint_ns", ""),
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+        self._store[thread_id] = CheckpointTuple(
+            config=next_config,
+            checkpoint=checkpoint,
+            metadata=metadata,
+        )
+        return next_config
+
+    def put_writes(self, config: Dict[str, Any], writes: Any, task_id: str, task_path: str = "") -> None:
+        """Pending writes are not tracked; the latest checkpoint is enough here."""
+        pass
+
+    async def aget_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
+        return self.get_tuple(config)
+
+    async def aput(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config: Dict[str, Any], writes: Any, task_id: str, task_path: str = "") -> None:
+        self.put_writes(config, writes, task_id, task_path)
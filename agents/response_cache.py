@@ -0,0 +1,84 @@
+"""
+Disk-Backed LLM Response Cache
+
+Caches model responses on disk keyed by a content hash of the request
+(model id + full message list + sampling params), so repeated prompts -
+common in the demo scripts and eval loops - skip the network round trip
+and the provider call entirely.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import List, Optional
+
+# Default cache location and entry lifetime
+DEFAULT_CACHE_DIR = ".llm_cache"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60  # 24 hours
+
+
+class ResponseCache:
+    """
+    Content-addressed response cache with JSON-on-disk storage.
+
+    Each entry is one JSON file named by the request hash, holding the
+    response text and a timestamp for TTL expiry. Set LLM_CACHE_DISABLE=1
+    to bypass the cache entirely.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.disabled = os.getenv("LLM_CACHE_DISABLE", "0") == "1"
+
+    @staticmethod
+    def make_key(model_id: str, messages: List, params: str = "") -> str:
+        """Build a stable sha256 key from the model, messages, and sampling params."""
+        serialized = json.dumps(
+            [[message.type, str(message.content)] for message in messages]
+        )
+        payload = serialized + model_id + params
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text, or None on miss/expiry."""
+        if self.disabled:
+            return None
+
+        try:
+            with open(self._entry_path(key), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Expire stale entries
+        if time.time() - entry.get("timestamp", 0) > self.ttl_seconds:
+            try:
+                os.remove(self._entry_path(key))
+            except OSError:
+                pass
+            return None
+
+        return entry.get("content")
+
+    def set(self, key: str, content: str) -> None:
+        """Store a response under the given request hash."""
+        if self.disabled:
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = {
+            "request_hash": key,
+            "content": content,
+            "timestamp": time.time(),
+        }
+        try:
+            with open(self._entry_path(key), "w") as f:
+                json.dump(entry, f)
+        except OSError:
+            # Cache writes are best-effort; never fail the actual call
+            pass
@@ -7,6 +7,7 @@ without modifying the agent code.
 
 import sys
 import os
+import asyncio
 
 # Add the parent directory to the path for imports
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
@@ -15,6 +16,9 @@ from guardrails import GuardrailsEngine
 from guardrails.input_guardrails.length_validator import LengthValidatorGuardrail
 from guardrails.output_guardrails.pii_filter import PIIFilterGuardrail
 
+# Commands that end the interactive demo
+_EXIT_CMDS = frozenset({"quit", "exit", "stop"})
+
 # Try to import an agent (will work if OpenAI is set up)
 try:
     from agents.agent_openai import OpenAIAgent
@@ -84,8 +88,8 @@ def demonstrate_basic_usage():
     return guarded_agent
 
 
-def test_scenarios(guarded_agent):
-    """Test various scenarios with the guarded agent."""
+async def test_scenarios(guarded_agent):
+    """Test various scenarios with the guarded agent, concurrently."""
     print("\n🧪 Testing Different Scenarios")
     print("=" * 50)
     
@@ -112,16 +116,24 @@ def test_scenarios(guarded_agent):
         }
     ]
     
-    for i, test_case in enumerate(test_cases, 1):
+    # The cases are independent, so launch them all at once and let the
+    # round trips overlap - wall clock drops from the sum of latencies
+    # to roughly the slowest single case
+    tasks = [
+        asyncio.to_thread(guarded_agent.chat, test_case['input'])
+        for test_case in test_cases
+    ]
+    responses = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for i, (test_case, response) in enumerate(zip(test_cases, responses), 1):
         print(f"\n📋 Test {i}: {test_case['name']}")
         print(f"Description: {test_case['description']}")
         print(f"Input: '{test_case['input']}'")
-        
-        try:
-            response = guarded_agent.chat(test_case['input'])
+
+        if isinstance(response, Exception):
+            print(f"❌ Blocked: {response}")
+        else:
             print(f"✅ Response: '{response}'")
-        except Exception as e:
-            print(f"❌ Blocked: {e}")
 
 
 def demonstrate_configuration():
@@ -172,7 +184,7 @@ def interactive_demo():
         try:
             user_input = input("\n💬 You: ").strip()
             
-            if user_input.lower() in ['quit', 'exit', 'stop']:
+            if user_input.lower() in _EXIT_CMDS:
                 print("👋 Goodbye!")
                 break
             
@@ -202,7 +214,7 @@ def main():
     guarded_agent = demonstrate_basic_usage()
     
     # Test scenarios
-    test_scenarios(guarded_agent)
+    asyncio.run(test_scenarios(guarded_agent))
     
     # Configuration demo
     demonstrate_configuration()
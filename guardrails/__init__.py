@@ -1,26 +1,11 @@
 """
 Trustwise Guardrails Framework
 
-A universal guardrails system that can wrap any agent to add safety, 
+A universal guardrails system that can wrap any agent to add safety,
 compliance, and monitoring capabilities without modifying the agent code.
 """
 
-from .core.engine import GuardrailsEngine
-from .core.wrapper import GuardedAgent
-from .core.base import InputGuardrail, OutputGuardrail, GuardrailResult
-from .core.adapters import (
-    AgentAdapter, 
-    ChatMethodAdapter, 
-    InvokeMethodAdapter, 
-    RunMethodAdapter, 
-    CallableAdapter,
-    CustomMethodAdapter,
-    OpenAIClientAdapter,
-    LangChainAgentAdapter,
-    create_adapter,
-    detect_agent_interface
-)
-from .utils.result import GuardrailStatus
+import importlib
 
 __version__ = "0.1.0"
 __author__ = "Trustwise Team"
@@ -28,7 +13,7 @@ __author__ = "Trustwise Team"
 # Main exports
 __all__ = [
     "GuardrailsEngine",
-    "GuardedAgent", 
+    "GuardedAgent",
     "InputGuardrail",
     "OutputGuardrail",
     "GuardrailResult",
@@ -36,7 +21,7 @@ __all__ = [
     # Adapter system
     "AgentAdapter",
     "ChatMethodAdapter",
-    "InvokeMethodAdapter", 
+    "InvokeMethodAdapter",
     "RunMethodAdapter",
     "CallableAdapter",
     "CustomMethodAdapter",
@@ -44,4 +29,40 @@ __all__ = [
     "LangChainAgentAdapter",
     "create_adapter",
     "detect_agent_interface"
-] 
\ No newline at end of file
+]
+
+# Lazy re-exports (PEP 562): importing the package loads no submodules
+# until a name is first accessed, keeping cold start cheap for users
+# who only touch a slice of the framework
+_EXPORTS = {
+    "GuardrailsEngine": ".core.engine",
+    "GuardedAgent": ".core.wrapper",
+    "InputGuardrail": ".core.base",
+    "OutputGuardrail": ".core.base",
+    "GuardrailResult": ".core.base",
+    "GuardrailStatus": ".utils.result",
+    "AgentAdapter": ".core.adapters",
+    "ChatMethodAdapter": ".core.adapters",
+    "InvokeMethodAdapter": ".core.adapters",
+    "RunMethodAdapter": ".core.adapters",
+    "CallableAdapter": ".core.adapters",
+    "CustomMethodAdapter": ".core.adapters",
+    "OpenAIClientAdapter": ".core.adapters",
+    "LangChainAgentAdapter": ".core.adapters",
+    "create_adapter": ".core.adapters",
+    "detect_agent_interface": ".core.adapters",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        # Cache on the package so the next access skips this hook
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,7 @@
 Agent Adapters - Normalize different agent interfaces for guardrails compatibility.
 """
 
+import functools
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Callable, Union
 import logging
@@ -11,25 +12,47 @@ logger = logging.getLogger(__name__)
 
 class AgentAdapter(ABC):
     """Base class for agent adapters that normalize different agent interfaces."""
-    
+
+    # Adapters sit on the per-request hot path, so they use __slots__
+    # (no instance __dict__) and pre-bind the underlying agent method in
+    # __init__ instead of resolving it on every chat() call
+    __slots__ = ("agent", "config")
+
     def __init__(self, agent: Any, config: Optional[Dict[str, Any]] = None):
         self.agent = agent
         self.config = config or {}
-    
+
     @abstractmethod
     def chat(self, user_input: str, **kwargs) -> str:
         """
         Normalize the agent interaction to a chat interface.
-        
+
         Args:
             user_input: The user's input text
             **kwargs: Additional arguments
-            
+
         Returns:
             str: The agent's response
         """
         pass
-    
+
+    def chat_stream(self, user_input: str, **kwargs):
+        """
+        Stream the agent's response chunk by chunk.
+
+        Adapters for natively streaming backends override this; the
+        default yields the complete chat() response as a single chunk so
+        every adapter supports the streaming path.
+
+        Args:
+            user_input: The user's input text
+            **kwargs: Additional arguments
+
+        Yields:
+            str: Response chunks
+        """
+        yield self.chat(user_input, **kwargs)
+
     def __getattr__(self, name: str) -> Any:
         """Delegate other method calls to the wrapped agent."""
         return getattr(self.agent, name)
@@ -37,19 +60,35 @@ class AgentAdapter(ABC):
 
 class ChatMethodAdapter(AgentAdapter):
     """Adapter for agents with a 'chat' method (default behavior)."""
-    
+
+    __slots__ = ("_chat_fn",)
+
+    def __init__(self, agent: Any, config: Optional[Dict[str, Any]] = None):
+        super().__init__(agent, config)
+        self._chat_fn = agent.chat
+
     def chat(self, user_input: str, **kwargs) -> str:
-        return self.agent.chat(user_input, **kwargs)
+        return self._chat_fn(user_input, **kwargs)
 
 
 class InvokeMethodAdapter(AgentAdapter):
     """Adapter for agents with an 'invoke' method (common in LangChain)."""
-    
+
+    __slots__ = ("input_key", "output_key", "_invoke_fn", "_extract")
+
     def __init__(self, agent: Any, config: Optional[Dict[str, Any]] = None):
         super().__init__(agent, config)
         self.input_key = self.config.get("input_key", "input")
         self.output_key = self.config.get("output_key", None)
-    
+        self._invoke_fn = agent.invoke
+        # Resolve the output-extraction strategy once instead of
+        # re-checking the configuration on every call
+        if self.output_key:
+            key = self.output_key
+            self._extract = lambda r: str(r.get(key, r)) if isinstance(r, dict) else str(r)
+        else:
+            self._extract = str
+
     def chat(self, user_input: str, **kwargs) -> str:
         # Prepare input based on configuration
         if self.input_key:
@@ -57,55 +96,57 @@ class InvokeMethodAdapter(AgentAdapter):
             input_data.update(kwargs)
         else:
             input_data = user_input
-        
-        # Call the agent
-        result = self.agent.invoke(input_data)
-        
-        # Extract output based on configuration
-        if self.output_key and isinstance(result, dict):
-            return str(result.get(self.output_key, result))
-        else:
-            return str(result)
+
+        return self._extract(self._invoke_fn(input_data))
 
 
 class RunMethodAdapter(AgentAdapter):
     """Adapter for agents with a 'run' method."""
-    
+
+    __slots__ = ("_run_fn",)
+
+    def __init__(self, agent: Any, config: Optional[Dict[str, Any]] = None):
+        super().__init__(agent, config)
+        self._run_fn = agent.run
+
     def chat(self, user_input: str, **kwargs) -> str:
-        return str(self.agent.run(user_input, **kwargs))
+        return str(self._run_fn(user_input, **kwargs))
 
 
 class CallableAdapter(AgentAdapter):
     """Adapter for callable agents (functions, callable objects)."""
-    
+
+    __slots__ = ()
+
     def chat(self, user_input: str, **kwargs) -> str:
         return str(self.agent(user_input, **kwargs))
 
 
 class CustomMethodAdapter(AgentAdapter):
     """Adapter for agents with custom method names."""
-    
+
+    __slots__ = ("method_name", "input_transform", "output_transform", "_method")
+
     def __init__(self, agent: Any, config: Optional[Dict[str, Any]] = None):
         super().__init__(agent, config)
         self.method_name = self.config.get("method_name")
         if not self.method_name:
             raise ValueError("method_name must be specified in config for CustomMethodAdapter")
-        
+
         self.input_transform = self.config.get("input_transform", lambda x, **kwargs: (x,), {})
         self.output_transform = self.config.get("output_transform", str)
-    
+        self._method = getattr(agent, self.method_name)
+
     def chat(self, user_input: str, **kwargs) -> str:
-        method = getattr(self.agent, self.method_name)
-        
         # Transform input
         if callable(self.input_transform):
             args, method_kwargs = self.input_transform(user_input, **kwargs)
         else:
             args, method_kwargs = (user_input,), kwargs
-        
+
         # Call the method
-        result = method(*args, **method_kwargs)
-        
+        result = self._method(*args, **method_kwargs)
+
         # Transform output
         if callable(self.output_transform):
             return self.output_transform(result)
@@ -115,61 +156,142 @@ class CustomMethodAdapter(AgentAdapter):
 
 class OpenAIClientAdapter(AgentAdapter):
     """Adapter for direct OpenAI client usage."""
-    
+
+    __slots__ = ("model", "system_prompt", "_create_fn")
+
     def __init__(self, agent: Any, config: Optional[Dict[str, Any]] = None):
         super().__init__(agent, config)
         self.model = self.config.get("model", "gpt-3.5-turbo")
         self.system_prompt = self.config.get("system_prompt", None)
-    
+        self._create_fn = agent.chat.completions.create
+
     def chat(self, user_input: str, **kwargs) -> str:
         messages = []
-        
+
         # Add system message if configured
         if self.system_prompt:
             messages.append({"role": "system", "content": self.system_prompt})
-        
+
         # Add user message
         messages.append({"role": "user", "content": user_input})
-        
+
         # Call OpenAI API
-        response = self.agent.chat.completions.create(
+        response = self._create_fn(
             model=self.model,
             messages=messages,
             **kwargs
         )
-        
+
         return response.choices[0].message.content
 
+    def chat_stream(self, user_input: str, **kwargs):
+        messages = []
+
+        if self.system_prompt:
+            messages.append({"role": "system", "content": self.system_prompt})
+
+        messages.append({"role": "user", "content": user_input})
+
+        # Stream deltas straight from the API
+        response = self._create_fn(
+            model=self.model,
+            messages=messages,
+            stream=True,
+            **kwargs
+        )
+
+        for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
 
 class LangChainAgentAdapter(AgentAdapter):
     """Adapter for LangChain agents."""
-    
-    def chat(self, user_input: str, **kwargs) -> str:
-        # Try different LangChain interfaces
-        if hasattr(self.agent, 'invoke'):
-            result = self.agent.invoke({"input": user_input})
-            # Handle different return types
-            if isinstance(result, dict):
-                return str(result.get("output", result.get("text", str(result))))
-            return str(result)
-        elif hasattr(self.agent, 'run'):
-            return str(self.agent.run(user_input))
+
+    __slots__ = ("_call",)
+
+    def __init__(self, agent: Any, config: Optional[Dict[str, Any]] = None):
+        super().__init__(agent, config)
+        # Probe the LangChain interface once and bind the matching call
+        # strategy; unsupported agents fail at construction, not per call
+        invoke = getattr(agent, 'invoke', None)
+        run = getattr(agent, 'run', None)
+        if invoke is not None:
+            def call(user_input):
+                result = invoke({"input": user_input})
+                # Handle different return types
+                if isinstance(result, dict):
+                    return str(result.get("output", result.get("text", str(result))))
+                return str(result)
+            self._call = call
+        elif run is not None:
+            self._call = lambda user_input: str(run(user_input))
         else:
             raise ValueError("Unsupported LangChain agent interface")
 
+    def chat(self, user_input: str, **kwargs) -> str:
+        return self._call(user_input)
+
+
+@functools.lru_cache(maxsize=128)
+def _detect_interface_for_class(agent_class: type) -> Optional[str]:
+    """
+    Detect the interface from class attributes alone.
+
+    This covers agents whose interface is defined on the class (the common
+    case) and is safe to memoize per class, avoiding repeated hasattr scans
+    when many agents of the same type are wrapped.
+    """
+    # The specific OpenAI-client shape (chat.completions) must be checked
+    # before the generic chat method, or it can never match
+    chat_attr = getattr(agent_class, 'chat', None)
+    if chat_attr is not None and hasattr(chat_attr, 'completions'):
+        return 'openai_client'
+    elif callable(chat_attr):
+        return 'chat'
+    elif chat_attr is not None:
+        # `chat` is a non-callable class attribute — e.g. a property or
+        # cached_property descriptor, the shape of current OpenAI
+        # clients. Only the instance can say what it resolves to, so
+        # defer to the instance-level checks instead of misrouting the
+        # agent through ChatMethodAdapter
+        return None
+    elif hasattr(agent_class, 'invoke'):
+        return 'invoke'
+    elif hasattr(agent_class, 'run'):
+        return 'run'
+    elif any('__call__' in klass.__dict__ for klass in agent_class.__mro__):
+        # Look for __call__ in the MRO rather than via hasattr: hasattr on
+        # a class also finds the metaclass's __call__, which would wrongly
+        # mark every instance as callable
+        return 'callable'
+    return None
+
 
 def detect_agent_interface(agent: Any) -> str:
     """
     Automatically detect the agent interface type.
-    
+
+    Results are memoized per agent class, falling back to instance-level
+    checks for agents that attach their interface in __init__.
+
     Args:
         agent: The agent to analyze
-        
+
     Returns:
         str: The detected interface type
     """
-    # Check for common method names in order of preference
-    if hasattr(agent, 'chat'):
+    detected = _detect_interface_for_class(type(agent))
+    if detected is not None:
+        return detected
+
+    # Check for common method names in order of preference; the OpenAI
+    # client shape (chat.completions) is more specific than a plain chat
+    # method, so it has to be checked first
+    if hasattr(agent, 'chat') and hasattr(agent.chat, 'completions'):
+        return 'openai_client'
+    elif hasattr(agent, 'chat'):
         return 'chat'
     elif hasattr(agent, 'invoke'):
         return 'invoke'
@@ -177,9 +299,6 @@ def detect_agent_interface(agent: Any) -> str:
         return 'run'
     elif callable(agent):
         return 'callable'
-    elif hasattr(agent, 'chat') and hasattr(agent.chat, 'completions'):
-        # Looks like OpenAI client
-        return 'openai_client'
     else:
         # Check for common agent types
         agent_type = type(agent).__name__
@@ -2,18 +2,241 @@
 Base classes for guardrails implementation.
 """
 
+import asyncio
+import re
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from ..utils.result import GuardrailResult
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from ..utils.result import GuardrailResult, GuardrailStatus
+
+# Optional accelerated regex backends; the stdlib fallback always works
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+@lru_cache(maxsize=512)
+def _compile(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a regex once per process; repeat callers share the result."""
+    return re.compile(pattern, flags)
+
+
+class MultiPatternMatcher:
+    """
+    Scan text for many named patterns in a single pass.
+
+    Pattern-heavy guardrails (e.g. PII filtering) otherwise run each
+    regex as a separate scan over the full text, making the hot path
+    O(patterns * length). This utility compiles all patterns once at
+    construction into the fastest available backend:
+
+    - hyperscan: one multi-pattern DFA scan
+    - google-re2: a RE2 Set to find which patterns match, then span
+      extraction only for those
+    - stdlib re: a single combined alternation
+
+    Usage: build once in the guardrail's __init__, then call
+    scan(text) per request.
+    """
+
+    def __init__(self, patterns: List[Tuple[str, str]]):
+        """
+        Args:
+            patterns: List of (name, pattern) tuples. Names may repeat
+                      (e.g. several phone formats under "phone").
+        """
+        self._names = [name for name, _ in patterns]
+        self._patterns = [pattern for _, pattern in patterns]
+        self._backend = "re"
+        self._db = None
+        self._re2_set = None
+        # Per-pattern compiled regexes, used for span extraction on the
+        # re2 path and kept for callers that need single-pattern checks
+        self._compiled = [_compile(p) for p in self._patterns]
+
+        if hyperscan is not None:
+            try:
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=[p.encode() for p in self._patterns],
+                    ids=list(range(len(self._patterns))),
+                    flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(self._patterns),
+                )
+                self._db = db
+                self._backend = "hyperscan"
+            except hyperscan.error:
+                # Some patterns (e.g. with backreferences) are not
+                # hyperscan-compatible; fall through to the next backend
+                pass
+
+        if self._backend == "re" and re2 is not None:
+            try:
+                pattern_set = re2.Set.SearchSet()
+                for p in self._patterns:
+                    pattern_set.Add(p)
+                pattern_set.Compile()
+                self._re2_set = pattern_set
+                self._backend = "re2"
+            except re2.error:
+                pass
+
+        if self._backend == "re":
+            # Combined alternation: one scan, group name encodes the
+            # pattern index (user-facing names may repeat or contain
+            # characters invalid in group names)
+            combined = "|".join(
+                f"(?P<g{i}>{p})" for i, p in enumerate(self._patterns)
+            )
+            self._combined = _compile(combined)
+            # ASCII-only pattern sets also compile in bytes mode, where
+            # _sre runs over a fixed-width buffer instead of walking
+            # Unicode code points; scan() uses it for ASCII text, where
+            # byte offsets equal character offsets
+            try:
+                self._combined_bytes = re.compile(combined.encode("ascii"))
+            except (UnicodeEncodeError, re.error):
+                self._combined_bytes = None
+
+    def scan(self, text: str) -> List[Tuple[str, int, int]]:
+        """
+        Find all pattern matches in the text in one pass.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List of (name, start, end) tuples in match order
+        """
+        if self._backend == "hyperscan":
+            # Hyperscan reports byte offsets; only for ASCII text do
+            # they equal the character offsets callers slice with (the
+            # same gate the stdlib bytes mode applies). Non-ASCII text
+            # takes per-pattern scans instead of returning shifted spans
+            if not text.isascii():
+                return [
+                    (self._names[pat_id], m.start(), m.end())
+                    for pat_id, compiled in enumerate(self._compiled)
+                    for m in compiled.finditer(text)
+                ]
+
+            matches = []
+
+            def on_match(pat_id, start, end, flags, context=None):
+                matches.append((self._names[pat_id], start, end))
+
+            self._db.scan(text.encode(), match_event_handler=on_match)
+            return matches
+
+        if self._backend == "re2":
+            hits = self._re2_set.Match(text) or []
+            matches = []
+            for pat_id in hits:
+                for m in self._compiled[pat_id].finditer(text):
+                    matches.append((self._names[pat_id], m.start(), m.end()))
+            return matches
+
+        names = self._names
+        if self._combined_bytes is not None and text.isascii():
+            return [
+                (names[int(m.lastgroup[1:])], m.start(), m.end())
+                for m in self._combined_bytes.finditer(text.encode("ascii"))
+            ]
+
+        return [
+            (names[int(m.lastgroup[1:])], m.start(), m.end())
+            for m in self._combined.finditer(text)
+        ]
+
+    def search(self, text: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Find the first match of any pattern, or None.
+
+        For callers that only need to know whether (and where) a match
+        exists — e.g. block-on-detection modes — this stops at the
+        first hit instead of enumerating every match in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            (name, start, end) of the earliest match, or None
+        """
+        if self._backend == "hyperscan":
+            if not text.isascii():
+                # Byte offsets would not match character offsets;
+                # scan() falls back per pattern, so do the same here
+                return self._search_per_pattern(text)
+            # Hyperscan reports matches through a callback with no
+            # early-termination guarantee across binding versions, so
+            # take the first hit of a full scan
+            matches = self.scan(text)
+            return min(matches, key=lambda m: (m[1], m[2])) if matches else None
+
+        if self._backend == "re2":
+            return self._search_per_pattern(text)
+
+        if self._combined_bytes is not None and text.isascii():
+            m = self._combined_bytes.search(text.encode("ascii"))
+        else:
+            m = self._combined.search(text)
+        if m is None:
+            return None
+        return (self._names[int(m.lastgroup[1:])], m.start(), m.end())
+
+    def _search_per_pattern(self, text: str) -> Optional[Tuple[str, int, int]]:
+        """Earliest match via one search per compiled pattern."""
+        best = None
+        for pat_id, compiled in enumerate(self._compiled):
+            m = compiled.search(text)
+            if m is not None and (best is None or m.start() < best[1]):
+                best = (self._names[pat_id], m.start(), m.end())
+        return best
 
 
 class BaseGuardrail(ABC):
     """Base class for all guardrails."""
-    
+
+    # Slot the base attributes so lookups on the hot path go through
+    # slot descriptors; subclasses that define extra attributes without
+    # their own __slots__ still get a __dict__ for those
+    __slots__ = ("name", "config", "enabled", "mutates", "tier", "confidence_threshold", "trusted")
+
+    # Shared per-process regex cache: guardrails that build patterns in
+    # __init__ should use self.compile(...) so identical patterns are
+    # compiled once across instances and engines
+    compile = staticmethod(_compile)
+
+    # Singleton success result for trivial guardrails: returning this
+    # instead of constructing a fresh result lets the engine detect the
+    # common pass case by identity and skip the content/metadata branches.
+    # Only suitable when there is no modified content or metadata to carry.
+    PASS_RESULT = GuardrailResult(status=GuardrailStatus.PASSED, message="ok")
+
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
-        self.name = name
+        # Interned: names are formatted into messages and compared on
+        # every request
+        self.name = sys.intern(name)
         self.config = config or {}
         self.enabled = self.config.get("enabled", True)
+        # Guardrails that modify content must run serially; pure validators
+        # can run concurrently on the async engine path
+        self.mutates = self.config.get("mutates", False)
+        # Execution tier: 0 = cheap checks (regex), higher tiers = more
+        # expensive detectors (small models, LLM judges). With skip_on_clear
+        # the engine stops once a lower tier passes confidently.
+        self.tier = self.config.get("tier", 0)
+        self.confidence_threshold = self.config.get("confidence_threshold", 1.0)
+        # Trusted guardrails (well-tested built-ins that return results
+        # instead of raising) run without the engine's try/except wrapper
+        # on the specialized hot path; user-supplied ones default False
+        self.trusted = self.config.get("trusted", False)
     
     def is_enabled(self) -> bool:
         """Check if this guardrail is enabled."""
@@ -25,7 +248,9 @@ class BaseGuardrail(ABC):
 
 class InputGuardrail(BaseGuardrail):
     """Base class for input guardrails that validate/filter user input."""
-    
+
+    __slots__ = ()
+
     @abstractmethod
     def validate(self, input_text: str, metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
         """
@@ -40,10 +265,41 @@ class InputGuardrail(BaseGuardrail):
         """
         pass
 
+    def validate_batch(self, texts: List[str], metadata_list: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[GuardrailResult]:
+        """
+        Validate a batch of texts in one call.
+
+        Guardrails backed by batchable engines (vectorized regex scans,
+        transformer pipelines) can override this to amortize per-call
+        overhead; the default simply validates each text in turn.
+
+        Args:
+            texts: The input texts to validate
+            metadata_list: Optional per-text metadata, aligned with texts
+
+        Returns:
+            List of GuardrailResult, one per input text
+        """
+        if metadata_list is None:
+            metadata_list = [None] * len(texts)
+        return [self.validate(t, m) for t, m in zip(texts, metadata_list)]
+
+    async def validate_async(self, input_text: str, metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
+        """
+        Async wrapper around validate().
+
+        Guardrails that do IO (e.g. model-backed checks) can override this;
+        the default runs the sync validate in a worker thread so the engine
+        can execute independent guardrails concurrently.
+        """
+        return await asyncio.to_thread(self.validate, input_text, metadata)
+
 
 class OutputGuardrail(BaseGuardrail):
     """Base class for output guardrails that filter/modify agent responses."""
-    
+
+    __slots__ = ()
+
     @abstractmethod
     def filter(self, output_text: str, input_text: str = "", metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
         """
@@ -57,4 +313,36 @@ class OutputGuardrail(BaseGuardrail):
         Returns:
             GuardrailResult: Result of the filtering with status and potentially modified content
         """
-        pass 
\ No newline at end of file
+        pass
+
+    def filter_batch(self, texts: List[str], input_texts: Optional[List[str]] = None, metadata_list: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[GuardrailResult]:
+        """
+        Filter a batch of output texts in one call.
+
+        Guardrails backed by batchable engines (vectorized regex scans,
+        transformer pipelines) can override this to amortize per-call
+        overhead; the default simply filters each text in turn.
+
+        Args:
+            texts: The output texts to filter
+            input_texts: Optional per-text original inputs, aligned with texts
+            metadata_list: Optional per-text metadata, aligned with texts
+
+        Returns:
+            List of GuardrailResult, one per output text
+        """
+        if input_texts is None:
+            input_texts = [""] * len(texts)
+        if metadata_list is None:
+            metadata_list = [None] * len(texts)
+        return [self.filter(t, i, m) for t, i, m in zip(texts, input_texts, metadata_list)]
+
+    async def filter_async(self, output_text: str, input_text: str = "", metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
+        """
+        Async wrapper around filter().
+
+        Guardrails that do IO (e.g. model-backed checks) can override this;
+        the default runs the sync filter in a worker thread so the engine
+        can execute independent guardrails concurrently.
+        """
+        return await asyncio.to_thread(self.filter, output_text, input_text, metadata) 
\ No newline at end of file
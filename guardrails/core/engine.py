@@ -2,7 +2,11 @@
 Guardrails Engine - Central controller for managing guardrails.
 """
 
+import asyncio
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import groupby
 from typing import List, Dict, Any, Optional, Union
 from .base import InputGuardrail, OutputGuardrail
 from .wrapper import GuardedAgent
@@ -33,7 +37,31 @@ class GuardrailsEngine:
         self.enabled = self.config.get("enabled", True)
         self.fail_fast = self.config.get("fail_fast", True)
         self.logging_enabled = self.config.get("logging", True)
-        
+        # With skip_on_clear, higher-tier (more expensive) guardrails are
+        # skipped once a lower tier passes with sufficient confidence
+        self.skip_on_clear = self.config.get("skip_on_clear", False)
+        # With parallel, pure validators run on a shared thread pool so
+        # N independent guardrails cost roughly the slowest one; the
+        # sequential path stays the default for backward compatibility
+        self.parallel = self.config.get("parallel", False)
+        self.max_workers = self.config.get("max_workers", None)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Memoized enabled-guardrail lists; invalidated whenever a
+        # guardrail is registered (see invalidate_enabled_cache)
+        self._enabled_input_cache: Optional[List[InputGuardrail]] = None
+        self._enabled_output_cache: Optional[List[OutputGuardrail]] = None
+        # Hot-path call lists: (guardrail, bound validate/filter) pairs so
+        # the per-request loops skip the attribute lookup per guardrail
+        self._input_calls_cache: Optional[List[tuple]] = None
+        self._output_calls_cache: Optional[List[tuple]] = None
+        # Specialized apply-loop closures compiled for the current
+        # configuration; False means "no specialization applies"
+        self._input_program = None
+        self._output_program = None
+        # Per-guardrail failure counters: a dict bump is far cheaper than
+        # string formatting, and the counts surface through get_stats()
+        self._fail_counts: Dict[str, int] = defaultdict(int)
+
         if self.logging_enabled:
             logging.basicConfig(level=logging.INFO)
     
@@ -48,7 +76,13 @@ class GuardrailsEngine:
             Self for method chaining
         """
         self.input_guardrails.append(guardrail)
-        logger.info(f"Added input guardrail: {guardrail}")
+        # Keep the list tier-sorted (stable, so registration order is
+        # preserved within a tier)
+        self.input_guardrails.sort(key=lambda g: g.tier)
+        self._enabled_input_cache = None
+        self._input_calls_cache = None
+        self._input_program = None
+        logger.info("Added input guardrail: %s", guardrail)
         return self
     
     def add_output_guardrail(self, guardrail: OutputGuardrail) -> 'GuardrailsEngine':
@@ -62,8 +96,379 @@ class GuardrailsEngine:
             Self for method chaining
         """
         self.output_guardrails.append(guardrail)
-        logger.info(f"Added output guardrail: {guardrail}")
+        # Keep the list tier-sorted (stable, so registration order is
+        # preserved within a tier)
+        self.output_guardrails.sort(key=lambda g: g.tier)
+        self._enabled_output_cache = None
+        self._output_calls_cache = None
+        self._output_program = None
+        logger.info("Added output guardrail: %s", guardrail)
         return self
+
+    def invalidate_enabled_cache(self) -> None:
+        """
+        Drop the memoized enabled-guardrail lists.
+
+        Call this after toggling a guardrail's enabled flag at runtime so
+        the next apply_* call re-scans the registered guardrails.
+        """
+        self._enabled_input_cache = None
+        self._enabled_output_cache = None
+        self._input_calls_cache = None
+        self._output_calls_cache = None
+        self._input_program = None
+        self._output_program = None
+
+    def _get_enabled_input(self) -> List[InputGuardrail]:
+        """Return the enabled input guardrails, computing the list lazily."""
+        if self._enabled_input_cache is None:
+            self._enabled_input_cache = [g for g in self.input_guardrails if g.enabled]
+        return self._enabled_input_cache
+
+    def _get_enabled_output(self) -> List[OutputGuardrail]:
+        """Return the enabled output guardrails, computing the list lazily."""
+        if self._enabled_output_cache is None:
+            self._enabled_output_cache = [g for g in self.output_guardrails if g.enabled]
+        return self._enabled_output_cache
+
+    def _get_input_calls(self) -> List[tuple]:
+        """Return (guardrail, bound validate) pairs for enabled input guardrails."""
+        if self._input_calls_cache is None:
+            self._input_calls_cache = [(g, g.validate) for g in self._get_enabled_input()]
+        return self._input_calls_cache
+
+    def _get_output_calls(self) -> List[tuple]:
+        """Return (guardrail, bound filter) pairs for enabled output guardrails."""
+        if self._output_calls_cache is None:
+            self._output_calls_cache = [(g, g.filter) for g in self._get_enabled_output()]
+        return self._output_calls_cache
+
+    def _compile_input_program(self):
+        """
+        Compile a specialized apply loop for the current configuration.
+
+        Only the common shape — fail_fast on, skip_on_clear off — is
+        specialized; it needs no tier grouping or message accumulation
+        beyond the success path, so the closure captures the enabled
+        (guardrail, bound method) pairs as a tuple and runs a tight loop.
+        Returns False when the configuration needs the general loop.
+        """
+        if not self.fail_fast or self.skip_on_clear or self.parallel:
+            return False
+
+        # Trusted guardrails (well-tested built-ins) skip the exception
+        # wrapper entirely on this path
+        calls = tuple((g, fn, g.trusted) for g, fn in self._get_input_calls())
+        pass_result = InputGuardrail.PASS_RESULT
+
+        def run(input_text, metadata):
+            current_text = input_text
+            combined_metadata = {}
+            messages = [None] * len(calls)
+            idx = 0
+            for guardrail, validate, trusted in calls:
+                if trusted:
+                    result = validate(current_text, metadata)
+                else:
+                    try:
+                        result = validate(current_text, metadata)
+                    except Exception as e:
+                        error_msg = f"Error in input guardrail {guardrail.name}: {str(e)}"
+                        logger.error(error_msg)
+                        return GuardrailResult(
+                            status=GuardrailStatus.FAILED,
+                            message=error_msg
+                        )
+
+                # Identity test for the singleton pass result: no content
+                # or metadata to merge, so skip those branches outright
+                if result is pass_result:
+                    messages[idx] = (guardrail.name, result.message)
+                    idx += 1
+                    continue
+
+                if result.is_failure:
+                    self._fail_counts[guardrail.name] += 1
+                    logger.warning("Input guardrail %s failed: %s", guardrail.name, result.message)
+                    return result
+
+                if result.modified_content is not None and result.modified_content is not current_text:
+                    current_text = result.modified_content
+
+                if result.metadata:
+                    combined_metadata.update(result.metadata)
+
+                messages[idx] = (guardrail.name, result.message)
+                idx += 1
+
+            final_message = "; ".join(f"{n}: {m}" for n, m in messages) or "All input guardrails passed"
+            return GuardrailResult(
+                status=GuardrailStatus.PASSED,
+                message=final_message,
+                modified_content=current_text,
+                metadata=combined_metadata
+            )
+
+        return run
+
+    def _compile_output_program(self):
+        """Output-side twin of _compile_input_program."""
+        if not self.fail_fast or self.skip_on_clear or self.parallel:
+            return False
+
+        # Trusted guardrails (well-tested built-ins) skip the exception
+        # wrapper entirely on this path
+        calls = tuple((g, fn, g.trusted) for g, fn in self._get_output_calls())
+        pass_result = OutputGuardrail.PASS_RESULT
+
+        def run(output_text, input_text, metadata):
+            current_text = output_text
+            combined_metadata = {}
+            messages = [None] * len(calls)
+            idx = 0
+            for guardrail, filter_fn, trusted in calls:
+                if trusted:
+                    result = filter_fn(current_text, input_text, metadata)
+                else:
+                    try:
+                        result = filter_fn(current_text, input_text, metadata)
+                    except Exception as e:
+                        error_msg = f"Error in output guardrail {guardrail.name}: {str(e)}"
+                        logger.error(error_msg)
+                        return GuardrailResult(
+                            status=GuardrailStatus.FAILED,
+                            message=error_msg
+                        )
+
+                # Identity test for the singleton pass result: no content
+                # or metadata to merge, so skip those branches outright
+                if result is pass_result:
+                    messages[idx] = (guardrail.name, result.message)
+                    idx += 1
+                    continue
+
+                if result.is_failure:
+                    self._fail_counts[guardrail.name] += 1
+                    logger.warning("Output guardrail %s failed: %s", guardrail.name, result.message)
+                    return result
+
+                if result.modified_content is not None and result.modified_content is not current_text:
+                    current_text = result.modified_content
+
+                if result.metadata:
+                    combined_metadata.update(result.metadata)
+
+                messages[idx] = (guardrail.name, result.message)
+                idx += 1
+
+            final_message = "; ".join(f"{n}: {m}" for n, m in messages) or "All output guardrails passed"
+            return GuardrailResult(
+                status=GuardrailStatus.PASSED,
+                message=final_message,
+                modified_content=current_text,
+                metadata=combined_metadata
+            )
+
+        return run
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared validator thread pool, creating it lazily."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="guardrails"
+            )
+        return self._executor
+
+    def _run_validators_parallel(self, validators: List, call, label: str):
+        """
+        Run pure validators on the thread pool, honoring fail_fast.
+
+        Args:
+            validators: Enabled non-mutating guardrails
+            call: callable(guardrail) -> GuardrailResult
+            label: "Input" or "Output", for logging
+
+        Returns:
+            Dict mapping guardrail -> result, or a single failing
+            GuardrailResult when fail_fast short-circuits
+        """
+        def run_one(guardrail):
+            try:
+                return call(guardrail)
+            except Exception as e:
+                error_msg = f"Error in {label.lower()} guardrail {guardrail.name}: {str(e)}"
+                logger.error(error_msg)
+                return GuardrailResult(status=GuardrailStatus.FAILED, message=error_msg)
+
+        executor = self._get_executor()
+        futures = {executor.submit(run_one, g): g for g in validators}
+        results = {}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                guardrail = futures[future]
+                if result.is_failure and self.fail_fast:
+                    for leftover in pending:
+                        leftover.cancel()
+                    self._fail_counts[guardrail.name] += 1
+                    logger.warning("%s guardrail %s failed: %s", label, guardrail.name, result.message)
+                    return result
+                results[guardrail] = result
+        return results
+
+    def _apply_input_parallel(self, input_text: str, metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
+        """Parallel variant of apply_input_guardrails (config parallel=True)."""
+        enabled = self._get_enabled_input()
+        validators = [g for g in enabled if not g.mutates]
+        mutators = [g for g in enabled if g.mutates]
+
+        combined_metadata = {}
+        messages = []
+        has_failures = False
+
+        outcome = self._run_validators_parallel(
+            validators, lambda g: g.validate(input_text, metadata), "Input"
+        )
+        if isinstance(outcome, GuardrailResult):
+            return outcome
+
+        for guardrail in validators:
+            result = outcome[guardrail]
+            if result.is_failure:
+                has_failures = True
+                self._fail_counts[guardrail.name] += 1
+                logger.warning("Input guardrail %s failed: %s", guardrail.name, result.message)
+            elif result.metadata:
+                combined_metadata.update(result.metadata)
+            messages.append(f"{guardrail.name}: {result.message}")
+
+        # Mutators run serially, threading the modified content through
+        current_text = input_text
+        for guardrail in mutators:
+            try:
+                result = guardrail.validate(current_text, metadata)
+
+                if result.is_failure:
+                    has_failures = True
+                    self._fail_counts[guardrail.name] += 1
+                    logger.warning("Input guardrail %s failed: %s", guardrail.name, result.message)
+                    if self.fail_fast:
+                        return result
+                    messages.append(f"{guardrail.name}: {result.message}")
+                else:
+                    if result.modified_content is not None:
+                        current_text = result.modified_content
+
+                    if result.metadata:
+                        combined_metadata.update(result.metadata)
+
+                    messages.append(f"{guardrail.name}: {result.message}")
+
+            except Exception as e:
+                has_failures = True
+                error_msg = f"Error in input guardrail {guardrail.name}: {str(e)}"
+                logger.error(error_msg)
+                if self.fail_fast:
+                    return GuardrailResult(
+                        status=GuardrailStatus.FAILED,
+                        message=error_msg
+                    )
+                messages.append(error_msg)
+
+        final_status = GuardrailStatus.FAILED if has_failures else GuardrailStatus.PASSED
+        final_message = "; ".join(messages) if messages else "All input guardrails passed"
+
+        return GuardrailResult(
+            status=final_status,
+            message=final_message,
+            modified_content=current_text,
+            metadata=combined_metadata
+        )
+
+    def _apply_output_parallel(self, output_text: str, input_text: str = "", metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
+        """Parallel variant of apply_output_guardrails (config parallel=True)."""
+        enabled = self._get_enabled_output()
+        validators = [g for g in enabled if not g.mutates]
+        mutators = [g for g in enabled if g.mutates]
+
+        combined_metadata = {}
+        messages = []
+        has_failures = False
+
+        outcome = self._run_validators_parallel(
+            validators, lambda g: g.filter(output_text, input_text, metadata), "Output"
+        )
+        if isinstance(outcome, GuardrailResult):
+            return outcome
+
+        for guardrail in validators:
+            result = outcome[guardrail]
+            if result.is_failure:
+                has_failures = True
+                self._fail_counts[guardrail.name] += 1
+                logger.warning("Output guardrail %s failed: %s", guardrail.name, result.message)
+            elif result.metadata:
+                combined_metadata.update(result.metadata)
+            messages.append(f"{guardrail.name}: {result.message}")
+
+        # Mutators run serially, threading the modified content through
+        current_text = output_text
+        for guardrail in mutators:
+            try:
+                result = guardrail.filter(current_text, input_text, metadata)
+
+                if result.is_failure:
+                    has_failures = True
+                    self._fail_counts[guardrail.name] += 1
+                    logger.warning("Output guardrail %s failed: %s", guardrail.name, result.message)
+                    if self.fail_fast:
+                        return result
+                    messages.append(f"{guardrail.name}: {result.message}")
+                else:
+                    if result.modified_content is not None:
+                        current_text = result.modified_content
+
+                    if result.metadata:
+                        combined_metadata.update(result.metadata)
+
+                    messages.append(f"{guardrail.name}: {result.message}")
+
+            except Exception as e:
+                has_failures = True
+                error_msg = f"Error in output guardrail {guardrail.name}: {str(e)}"
+                logger.error(error_msg)
+                if self.fail_fast:
+                    return GuardrailResult(
+                        status=GuardrailStatus.FAILED,
+                        message=error_msg
+                    )
+                messages.append(error_msg)
+
+        final_status = GuardrailStatus.FAILED if has_failures else GuardrailStatus.PASSED
+        final_message = "; ".join(messages) if messages else "All output guardrails passed"
+
+        return GuardrailResult(
+            status=final_status,
+            message=final_message,
+            modified_content=current_text,
+            metadata=combined_metadata
+        )
+
+    @staticmethod
+    def _tier_cleared(tier_results: List) -> bool:
+        """Check whether every guardrail in a tier passed confidently."""
+        for guardrail, result in tier_results:
+            if result.status != GuardrailStatus.PASSED:
+                return False
+            confidence = result.confidence
+            if confidence is None:
+                confidence = (result.metadata or {}).get("confidence", 1.0)
+            if confidence < guardrail.confidence_threshold:
+                return False
+        return True
     
     def apply_input_guardrails(self, input_text: str, metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
         """
@@ -82,36 +487,276 @@ class GuardrailsEngine:
                 message="Guardrails engine disabled",
                 modified_content=input_text
             )
-        
+
+        if self.parallel:
+            return self._apply_input_parallel(input_text, metadata)
+
+        # Dispatch to the specialized program when one applies
+        if self._input_program is None:
+            self._input_program = self._compile_input_program()
+        if self._input_program is not False:
+            return self._input_program(input_text, metadata)
+
         current_text = input_text
         combined_metadata = {}
-        messages = []
         has_failures = False
+
+        calls = self._get_input_calls()
+        # Preallocate message slots and assign by index; tiers skipped via
+        # skip_on_clear leave None holes that the final join filters out
+        messages = [None] * len(calls)
+        idx = 0
+        for tier, group in groupby(calls, key=lambda pair: pair[0].tier):
+            tier_results = []
+            for guardrail, validate in group:
+                try:
+                    result = validate(current_text, metadata)
+
+                    if result.is_failure:
+                        has_failures = True
+                        self._fail_counts[guardrail.name] += 1
+                        logger.warning("Input guardrail %s failed: %s", guardrail.name, result.message)
+                        if self.fail_fast:
+                            return result
+                        messages[idx] = (guardrail.name, result.message)
+                    else:
+                        # Use modified content if available (identity check
+                        # skips the no-op reassignment when nothing changed)
+                        if result.modified_content is not None and result.modified_content is not current_text:
+                            current_text = result.modified_content
+
+                        # Collect metadata
+                        if result.metadata:
+                            combined_metadata.update(result.metadata)
+
+                        messages[idx] = (guardrail.name, result.message)
+
+                    tier_results.append((guardrail, result))
+
+                except Exception as e:
+                    has_failures = True
+                    error_msg = f"Error in input guardrail {guardrail.name}: {str(e)}"
+                    logger.error(error_msg)
+                    if self.fail_fast:
+                        return GuardrailResult(
+                            status=GuardrailStatus.FAILED,
+                            message=error_msg
+                        )
+                    messages[idx] = error_msg
+                idx += 1
+
+            # Cheap tiers act as gatekeepers: once a tier clears confidently,
+            # skip the more expensive tiers entirely
+            if self.skip_on_clear and not has_failures and self._tier_cleared(tier_results):
+                break
+
+        # Return appropriate status based on whether any guardrails failed
+        final_status = GuardrailStatus.FAILED if has_failures else GuardrailStatus.PASSED
+        final_message = "; ".join(m if isinstance(m, str) else f"{m[0]}: {m[1]}" for m in messages if m) or "All input guardrails passed"
         
-        for guardrail in self.input_guardrails:
-            if not guardrail.is_enabled():
-                continue
-                
+        return GuardrailResult(
+            status=final_status,
+            message=final_message,
+            modified_content=current_text,
+            metadata=combined_metadata
+        )
+    
+    def apply_output_guardrails(self, output_text: str, input_text: str = "", metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
+        """
+        Apply all output guardrails to the output text.
+        
+        Args:
+            output_text: The agent's response text
+            input_text: The original user input
+            metadata: Optional metadata about the request
+            
+        Returns:
+            GuardrailResult: Combined result of all output guardrails
+        """
+        if not self.enabled:
+            return GuardrailResult(
+                status=GuardrailStatus.PASSED,
+                message="Guardrails engine disabled",
+                modified_content=output_text
+            )
+
+        if self.parallel:
+            return self._apply_output_parallel(output_text, input_text, metadata)
+
+        # Dispatch to the specialized program when one applies
+        if self._output_program is None:
+            self._output_program = self._compile_output_program()
+        if self._output_program is not False:
+            return self._output_program(output_text, input_text, metadata)
+
+        current_text = output_text
+        combined_metadata = {}
+        has_failures = False
+
+        calls = self._get_output_calls()
+        # Preallocate message slots and assign by index; tiers skipped via
+        # skip_on_clear leave None holes that the final join filters out
+        messages = [None] * len(calls)
+        idx = 0
+        for tier, group in groupby(calls, key=lambda pair: pair[0].tier):
+            tier_results = []
+            for guardrail, filter_fn in group:
+                try:
+                    result = filter_fn(current_text, input_text, metadata)
+
+                    if result.is_failure:
+                        has_failures = True
+                        self._fail_counts[guardrail.name] += 1
+                        logger.warning("Output guardrail %s failed: %s", guardrail.name, result.message)
+                        if self.fail_fast:
+                            return result
+                        messages[idx] = (guardrail.name, result.message)
+                    else:
+                        # Use modified content if available (identity check
+                        # skips the no-op reassignment when nothing changed)
+                        if result.modified_content is not None and result.modified_content is not current_text:
+                            current_text = result.modified_content
+
+                        # Collect metadata
+                        if result.metadata:
+                            combined_metadata.update(result.metadata)
+
+                        messages[idx] = (guardrail.name, result.message)
+
+                    tier_results.append((guardrail, result))
+
+                except Exception as e:
+                    has_failures = True
+                    error_msg = f"Error in output guardrail {guardrail.name}: {str(e)}"
+                    logger.error(error_msg)
+                    if self.fail_fast:
+                        return GuardrailResult(
+                            status=GuardrailStatus.FAILED,
+                            message=error_msg
+                        )
+                    messages[idx] = error_msg
+                idx += 1
+
+            # Cheap tiers act as gatekeepers: once a tier clears confidently,
+            # skip the more expensive tiers entirely
+            if self.skip_on_clear and not has_failures and self._tier_cleared(tier_results):
+                break
+
+        # Return appropriate status based on whether any guardrails failed
+        final_status = GuardrailStatus.FAILED if has_failures else GuardrailStatus.PASSED
+        final_message = "; ".join(m if isinstance(m, str) else f"{m[0]}: {m[1]}" for m in messages if m) or "All output guardrails passed"
+        
+        return GuardrailResult(
+            status=final_status,
+            message=final_message,
+            modified_content=current_text,
+            metadata=combined_metadata
+        )
+    
+    async def _gather_results(self, tasks: List) -> Union[List[GuardrailResult], GuardrailResult]:
+        """
+        Await concurrent validator tasks, honoring fail_fast.
+
+        With fail_fast, the first failing GuardrailResult is returned as
+        soon as it lands and the remaining tasks are cancelled; otherwise
+        all results are returned in task order.
+        """
+        if not tasks:
+            return []
+
+        if not self.fail_fast:
+            return list(await asyncio.gather(*tasks))
+
+        pending = set(tasks)
+        completed = {}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if result.is_failure:
+                    for leftover in pending:
+                        leftover.cancel()
+                    return result
+                completed[task] = result
+        return [completed[task] for task in tasks]
+
+    async def apply_input_guardrails_async(self, input_text: str, metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
+        """
+        Async variant of apply_input_guardrails.
+
+        Pure validators run concurrently via asyncio.gather, so N
+        independent guardrails cost roughly the slowest one instead of the
+        sum. Guardrails that modify content (mutates=True) still run
+        serially in registration order so modifications stay deterministic.
+
+        Args:
+            input_text: The user's input text
+            metadata: Optional metadata about the request
+
+        Returns:
+            GuardrailResult: Combined result of all input guardrails
+        """
+        if not self.enabled:
+            return GuardrailResult(
+                status=GuardrailStatus.PASSED,
+                message="Guardrails engine disabled",
+                modified_content=input_text
+            )
+
+        enabled = self._get_enabled_input()
+        validators = [g for g in enabled if not g.mutates]
+        mutators = [g for g in enabled if g.mutates]
+
+        combined_metadata = {}
+        messages = []
+        has_failures = False
+
+        async def run_validator(guardrail):
             try:
-                result = guardrail.validate(current_text, metadata)
-                
+                return await guardrail.validate_async(input_text, metadata)
+            except Exception as e:
+                error_msg = f"Error in input guardrail {guardrail.name}: {str(e)}"
+                logger.error(error_msg)
+                return GuardrailResult(status=GuardrailStatus.FAILED, message=error_msg)
+
+        # Kick off all pure validators at once
+        tasks = [asyncio.create_task(run_validator(g)) for g in validators]
+        outcome = await self._gather_results(tasks)
+        if isinstance(outcome, GuardrailResult):
+            logger.warning("Input guardrail failed: %s", outcome.message)
+            return outcome
+
+        for guardrail, result in zip(validators, outcome):
+            if result.is_failure:
+                has_failures = True
+                self._fail_counts[guardrail.name] += 1
+                logger.warning("Input guardrail %s failed: %s", guardrail.name, result.message)
+            elif result.metadata:
+                combined_metadata.update(result.metadata)
+            messages.append(f"{guardrail.name}: {result.message}")
+
+        # Mutators run serially, threading the modified content through
+        current_text = input_text
+        for guardrail in mutators:
+            try:
+                result = await guardrail.validate_async(current_text, metadata)
+
                 if result.is_failure:
                     has_failures = True
-                    logger.warning(f"Input guardrail {guardrail.name} failed: {result.message}")
+                    self._fail_counts[guardrail.name] += 1
+                    logger.warning("Input guardrail %s failed: %s", guardrail.name, result.message)
                     if self.fail_fast:
                         return result
                     messages.append(f"{guardrail.name}: {result.message}")
                 else:
-                    # Use modified content if available
                     if result.modified_content is not None:
                         current_text = result.modified_content
-                    
-                    # Collect metadata
+
                     if result.metadata:
                         combined_metadata.update(result.metadata)
-                    
+
                     messages.append(f"{guardrail.name}: {result.message}")
-                    
+
             except Exception as e:
                 has_failures = True
                 error_msg = f"Error in input guardrail {guardrail.name}: {str(e)}"
@@ -122,27 +767,30 @@ class GuardrailsEngine:
                         message=error_msg
                     )
                 messages.append(error_msg)
-        
-        # Return appropriate status based on whether any guardrails failed
+
         final_status = GuardrailStatus.FAILED if has_failures else GuardrailStatus.PASSED
         final_message = "; ".join(messages) if messages else "All input guardrails passed"
-        
+
         return GuardrailResult(
             status=final_status,
             message=final_message,
             modified_content=current_text,
             metadata=combined_metadata
         )
-    
-    def apply_output_guardrails(self, output_text: str, input_text: str = "", metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
+
+    async def apply_output_guardrails_async(self, output_text: str, input_text: str = "", metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
         """
-        Apply all output guardrails to the output text.
-        
+        Async variant of apply_output_guardrails.
+
+        Pure validators run concurrently; mutating guardrails (e.g. PII
+        masking) run serially in registration order, mirroring
+        apply_input_guardrails_async.
+
         Args:
             output_text: The agent's response text
             input_text: The original user input
             metadata: Optional metadata about the request
-            
+
         Returns:
             GuardrailResult: Combined result of all output guardrails
         """
@@ -152,36 +800,61 @@ class GuardrailsEngine:
                 message="Guardrails engine disabled",
                 modified_content=output_text
             )
-        
-        current_text = output_text
+
+        enabled = self._get_enabled_output()
+        validators = [g for g in enabled if not g.mutates]
+        mutators = [g for g in enabled if g.mutates]
+
         combined_metadata = {}
         messages = []
         has_failures = False
-        
-        for guardrail in self.output_guardrails:
-            if not guardrail.is_enabled():
-                continue
-                
+
+        async def run_validator(guardrail):
             try:
-                result = guardrail.filter(current_text, input_text, metadata)
-                
+                return await guardrail.filter_async(output_text, input_text, metadata)
+            except Exception as e:
+                error_msg = f"Error in output guardrail {guardrail.name}: {str(e)}"
+                logger.error(error_msg)
+                return GuardrailResult(status=GuardrailStatus.FAILED, message=error_msg)
+
+        # Kick off all pure validators at once
+        tasks = [asyncio.create_task(run_validator(g)) for g in validators]
+        outcome = await self._gather_results(tasks)
+        if isinstance(outcome, GuardrailResult):
+            logger.warning("Output guardrail failed: %s", outcome.message)
+            return outcome
+
+        for guardrail, result in zip(validators, outcome):
+            if result.is_failure:
+                has_failures = True
+                self._fail_counts[guardrail.name] += 1
+                logger.warning("Output guardrail %s failed: %s", guardrail.name, result.message)
+            elif result.metadata:
+                combined_metadata.update(result.metadata)
+            messages.append(f"{guardrail.name}: {result.message}")
+
+        # Mutators run serially, threading the modified content through
+        current_text = output_text
+        for guardrail in mutators:
+            try:
+                result = await guardrail.filter_async(current_text, input_text, metadata)
+
                 if result.is_failure:
                     has_failures = True
-                    logger.warning(f"Output guardrail {guardrail.name} failed: {result.message}")
+                    self._fail_counts[guardrail.name] += 1
+                    logger.warning("Output guardrail %s failed: %s", guardrail.name, result.message)
                     if self.fail_fast:
                         return result
                     messages.append(f"{guardrail.name}: {result.message}")
                 else:
-                    # Use modified content if available
                     if result.modified_content is not None:
                         current_text = result.modified_content
-                    
-                    # Collect metadata
+
                     if result.metadata:
                         combined_metadata.update(result.metadata)
-                    
+
                     messages.append(f"{guardrail.name}: {result.message}")
-                    
+
             except Exception as e:
                 has_failures = True
                 error_msg = f"Error in output guardrail {guardrail.name}: {str(e)}"
@@ -192,18 +865,285 @@ class GuardrailsEngine:
                         message=error_msg
                     )
                 messages.append(error_msg)
-        
-        # Return appropriate status based on whether any guardrails failed
+
         final_status = GuardrailStatus.FAILED if has_failures else GuardrailStatus.PASSED
         final_message = "; ".join(messages) if messages else "All output guardrails passed"
-        
+
         return GuardrailResult(
             status=final_status,
             message=final_message,
             modified_content=current_text,
             metadata=combined_metadata
         )
-    
+
+    def apply_input_guardrails_batch(self, texts: List[str], metadata_list: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[GuardrailResult]:
+        """
+        Apply input guardrails to a batch of texts.
+
+        Iterates guardrail-major (each guardrail sees the whole batch via
+        validate_batch), so model-backed guardrails can run vectorized or
+        batched inference instead of one call per text. With fail_fast, a
+        text that fails drops out of later batches; the other texts keep
+        going.
+
+        Args:
+            texts: The input texts to validate
+            metadata_list: Optional per-text metadata, aligned with texts
+
+        Returns:
+            List of GuardrailResult, one per input text, in input order
+        """
+        if not self.enabled:
+            return [
+                GuardrailResult(
+                    status=GuardrailStatus.PASSED,
+                    message="Guardrails engine disabled",
+                    modified_content=text
+                )
+                for text in texts
+            ]
+
+        if metadata_list is None:
+            metadata_list = [None] * len(texts)
+
+        current = list(texts)
+        combined_metadata = [{} for _ in texts]
+        messages = [[] for _ in texts]
+        has_failures = [False] * len(texts)
+        # Slots filled once a text's outcome is settled (fail_fast)
+        final = [None] * len(texts)
+
+        for guardrail in self._get_enabled_input():
+            active = [i for i in range(len(texts)) if final[i] is None]
+            if not active:
+                break
+
+            try:
+                batch_results = guardrail.validate_batch(
+                    [current[i] for i in active],
+                    [metadata_list[i] for i in active]
+                )
+            except Exception as e:
+                error_msg = f"Error in input guardrail {guardrail.name}: {str(e)}"
+                logger.error(error_msg)
+                for i in active:
+                    has_failures[i] = True
+                    if self.fail_fast:
+                        final[i] = GuardrailResult(
+                            status=GuardrailStatus.FAILED,
+                            message=error_msg
+                        )
+                    else:
+                        messages[i].append(error_msg)
+                continue
+
+            for i, result in zip(active, batch_results):
+                if result.is_failure:
+                    has_failures[i] = True
+                    self._fail_counts[guardrail.name] += 1
+                    logger.warning("Input guardrail %s failed: %s", guardrail.name, result.message)
+                    if self.fail_fast:
+                        final[i] = result
+                        continue
+                    messages[i].append(f"{guardrail.name}: {result.message}")
+                else:
+                    if result.modified_content is not None:
+                        current[i] = result.modified_content
+
+                    if result.metadata:
+                        combined_metadata[i].update(result.metadata)
+
+                    messages[i].append(f"{guardrail.name}: {result.message}")
+
+        results = []
+        for i in range(len(texts)):
+            if final[i] is not None:
+                results.append(final[i])
+                continue
+            status = GuardrailStatus.FAILED if has_failures[i] else GuardrailStatus.PASSED
+            message = "; ".join(messages[i]) if messages[i] else "All input guardrails passed"
+            results.append(GuardrailResult(
+                status=status,
+                message=message,
+                modified_content=current[i],
+                metadata=combined_metadata[i]
+            ))
+        return results
+
+    def apply_output_guardrails_batch(self, texts: List[str], input_texts: Optional[List[str]] = None, metadata_list: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[GuardrailResult]:
+        """
+        Apply output guardrails to a batch of texts.
+
+        Mirrors apply_input_guardrails_batch: iterates guardrail-major
+        (each guardrail sees the whole batch via filter_batch) so
+        model-backed guardrails can run vectorized or batched inference.
+        With fail_fast, a text that fails drops out of later batches;
+        the other texts keep going.
+
+        Args:
+            texts: The output texts to filter
+            input_texts: Optional per-text original inputs, aligned with texts
+            metadata_list: Optional per-text metadata, aligned with texts
+
+        Returns:
+            List of GuardrailResult, one per output text, in input order
+        """
+        if not self.enabled:
+            return [
+                GuardrailResult(
+                    status=GuardrailStatus.PASSED,
+                    message="Guardrails engine disabled",
+                    modified_content=text
+                )
+                for text in texts
+            ]
+
+        if input_texts is None:
+            input_texts = [""] * len(texts)
+        if metadata_list is None:
+            metadata_list = [None] * len(texts)
+
+        current = list(texts)
+        combined_metadata = [{} for _ in texts]
+        messages = [[] for _ in texts]
+        has_failures = [False] * len(texts)
+        # Slots filled once a text's outcome is settled (fail_fast)
+        final = [None] * len(texts)
+
+        for guardrail in self._get_enabled_output():
+            active = [i for i in range(len(texts)) if final[i] is None]
+            if not active:
+                break
+
+            try:
+                batch_results = guardrail.filter_batch(
+                    [current[i] for i in active],
+                    [input_texts[i] for i in active],
+                    [metadata_list[i] for i in active]
+                )
+            except Exception as e:
+                error_msg = f"Error in output guardrail {guardrail.name}: {str(e)}"
+                logger.error(error_msg)
+                for i in active:
+                    has_failures[i] = True
+                    if self.fail_fast:
+                        final[i] = GuardrailResult(
+                            status=GuardrailStatus.FAILED,
+                            message=error_msg
+                        )
+                    else:
+                        messages[i].append(error_msg)
+                continue
+
+            for i, result in zip(active, batch_results):
+                if result.is_failure:
+                    has_failures[i] = True
+                    self._fail_counts[guardrail.name] += 1
+                    logger.warning("Output guardrail %s failed: %s", guardrail.name, result.message)
+                    if self.fail_fast:
+                        final[i] = result
+                        continue
+                    messages[i].append(f"{guardrail.name}: {result.message}")
+                else:
+                    if result.modified_content is not None:
+                        current[i] = result.modified_content
+
+                    if result.metadata:
+                        combined_metadata[i].update(result.metadata)
+
+                    messages[i].append(f"{guardrail.name}: {result.message}")
+
+        results = []
+        for i in range(len(texts)):
+            if final[i] is not None:
+                results.append(final[i])
+                continue
+            status = GuardrailStatus.FAILED if has_failures[i] else GuardrailStatus.PASSED
+            message = "; ".join(messages[i]) if messages[i] else "All output guardrails passed"
+            results.append(GuardrailResult(
+                status=status,
+                message=message,
+                modified_content=current[i],
+                metadata=combined_metadata[i]
+            ))
+        return results
+
+    def apply_output_guardrails_stream(self, chunks, input_text: str = "", metadata: Optional[Dict[str, Any]] = None, lookback: int = 64):
+        """
+        Apply output guardrails incrementally over a chunk stream.
+
+        Instead of waiting for the full response, text is released
+        through the guardrails as it arrives. The last `lookback`
+        characters are always held back (fail-closed) so patterns that
+        straddle chunk boundaries are still seen whole; lookback should
+        exceed the longest pattern a guardrail can match. Before each
+        release the whole buffer is scanned, and any match whose span
+        crosses the release cut extends the holdback to its start, so a
+        match is never split by the cut and released half-unmasked.
+
+        Args:
+            chunks: Iterator of response text chunks
+            input_text: The original user input
+            metadata: Optional metadata about the request
+            lookback: Characters to hold back between releases
+
+        Yields:
+            str: Sanitized response text
+
+        Raises:
+            RuntimeError: If a segment is blocked by output guardrails
+        """
+        # A disabled engine passes text through on every other apply_*
+        # entry point; do the same here instead of probing guardrails
+        # that will not run
+        if not self.enabled:
+            yield from chunks
+            return
+
+        buffer = ""
+
+        def release(segment):
+            result = self.apply_output_guardrails(segment, input_text, metadata)
+            if result.is_failure:
+                raise RuntimeError(f"Output blocked by guardrails: {result.message}")
+            sanitized = result.modified_content
+            return segment if sanitized is None else sanitized
+
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) <= lookback:
+                continue
+
+            # Scan the whole buffer before cutting: guardrails that
+            # report detection spans (e.g. the PII filter) pull the cut
+            # back to the start of any match that would straddle it, so
+            # the released segment never contains part of a match. For
+            # guardrails without span metadata the fixed lookback is
+            # still the only protection.
+            probe = self.apply_output_guardrails(buffer, input_text, metadata)
+            if probe.is_failure:
+                raise RuntimeError(f"Output blocked by guardrails: {probe.message}")
+
+            cut = len(buffer) - lookback
+            for detection in (probe.metadata or {}).get("detections", ()):
+                start, end = detection.get("start"), detection.get("end")
+                if start is not None and end is not None and start < cut < end:
+                    # Detections never overlap, so one pass settles the cut
+                    cut = start
+            if cut <= 0:
+                continue
+
+            segment, buffer = buffer[:cut], buffer[cut:]
+            sanitized = release(segment)
+            if sanitized:
+                yield sanitized
+
+        # Flush whatever is still held back
+        if buffer:
+            sanitized = release(buffer)
+            if sanitized:
+                yield sanitized
+
     def wrap_agent(self, agent: Any, adapter_type: Optional[str] = None, adapter_config: Optional[Dict[str, Any]] = None) -> GuardedAgent:
         """
         Wrap an agent with guardrails protection.
@@ -217,12 +1157,20 @@ class GuardrailsEngine:
         Returns:
             GuardedAgent: Wrapped agent with guardrails
         """
+        # Fast path: an agent that already exposes chat(str) -> str needs no
+        # normalization, so skip the adapter and save one Python frame per
+        # request. An OpenAI client's `chat` attribute is a namespace, not a
+        # callable, so it still goes through adapter detection below.
+        if adapter_type in (None, 'chat') and adapter_config is None and callable(getattr(agent, 'chat', None)):
+            logger.info("Using raw agent without adapter: %s", type(agent).__name__)
+            return GuardedAgent(agent, self)
+
         # Create an adapter to normalize the agent interface
         try:
             adapter = create_adapter(agent, adapter_type, adapter_config)
-            logger.info(f"Successfully created adapter for agent: {type(agent).__name__}")
+            logger.info("Successfully created adapter for agent: %s", type(agent).__name__)
         except Exception as e:
-            logger.error(f"Failed to create adapter for agent {type(agent).__name__}: {e}")
+            logger.error("Failed to create adapter for agent %s: %s", type(agent).__name__, e)
             raise ValueError(f"Unable to wrap agent: {e}")
         
         return GuardedAgent(adapter, self)
@@ -240,6 +1188,7 @@ class GuardrailsEngine:
             "output_guardrails": len(self.output_guardrails),
             "total_guardrails": len(self.input_guardrails) + len(self.output_guardrails),
             "fail_fast": self.fail_fast,
+            "fail_counts": dict(self._fail_counts),
             "input_guardrails_list": [str(g) for g in self.input_guardrails],
             "output_guardrails_list": [str(g) for g in self.output_guardrails]
         }
@@ -2,8 +2,9 @@
 Guarded Agent - Wrapper that adds guardrails to any agent.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from ..utils.result import GuardrailStatus
 
 logger = logging.getLogger(__name__)
@@ -27,10 +28,29 @@ class GuardedAgent:
         """
         self.agent = agent_or_adapter
         self.engine = guardrails_engine
-        
+
         # The adapter should always have a chat method
         if not hasattr(self.agent, 'chat'):
             raise ValueError("Agent adapter must have a 'chat' method")
+
+        # Type names are fixed for the wrapper's lifetime; resolving them
+        # once keeps the per-request metadata dict to a plain literal
+        self._agent_type_name = type(self.agent).__name__
+        self._original_agent_type_name = type(getattr(self.agent, 'agent', self.agent)).__name__
+
+        # Bind the agent's other public methods directly on the wrapper,
+        # so delegated calls hit a plain instance attribute instead of
+        # going through the attribute-miss -> __getattr__ -> getattr chain
+        own_names = dir(type(self))
+        for attr_name in dir(self.agent):
+            if attr_name.startswith('_') or attr_name in own_names or attr_name in self.__dict__:
+                continue
+            try:
+                value = getattr(self.agent, attr_name)
+            except AttributeError:
+                continue
+            if callable(value):
+                setattr(self, attr_name, value)
     
     def chat(self, user_input: str, **kwargs) -> str:
         """
@@ -50,32 +70,42 @@ class GuardedAgent:
         # Extract metadata for guardrails
         metadata = {
             "kwargs": kwargs,
-            "agent_type": type(self.agent).__name__,
-            "original_agent_type": type(getattr(self.agent, 'agent', self.agent)).__name__
+            "agent_type": self._agent_type_name,
+            "original_agent_type": self._original_agent_type_name
         }
         
-        # Apply input guardrails
-        logger.info(f"Applying input guardrails to: '{user_input[:50]}...'")
-        input_result = self.engine.apply_input_guardrails(user_input, metadata)
-        
-        if input_result.is_failure:
-            error_msg = f"Input blocked by guardrails: {input_result.message}"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        # Use the potentially modified input
-        processed_input = input_result.content or user_input
-        
-        if input_result.modified_content:
-            logger.info(f"Input modified by guardrails: '{processed_input[:50]}...'")
-        
+        # Apply input guardrails; skip the engine round-trip entirely
+        # when none are registered
+        if self.engine.input_guardrails:
+            logger.info("Applying input guardrails to: '%.50s'", user_input)
+            input_result = self.engine.apply_input_guardrails(user_input, metadata)
+
+            if input_result.is_failure:
+                error_msg = f"Input blocked by guardrails: {input_result.message}"
+                logger.error(error_msg)
+                raise ValueError(error_msg)
+
+            # Use the potentially modified input
+            processed_input = input_result.modified_content
+            if processed_input is None:
+                processed_input = user_input
+
+            if input_result.modified_content:
+                logger.info("Input modified by guardrails: '%.50s'", processed_input)
+        else:
+            processed_input = user_input
+
         try:
             # Call the agent through the adapter
-            logger.info(f"Calling agent via adapter: {type(self.agent).__name__}")
+            logger.info("Calling agent via adapter: %s", self._agent_type_name)
             agent_response = self.agent.chat(processed_input, **kwargs)
             
-            # Apply output guardrails
-            logger.info(f"Applying output guardrails to response: '{agent_response[:50]}...'")
+            # Apply output guardrails; with none registered the response
+            # goes back as-is
+            if not self.engine.output_guardrails:
+                return agent_response
+
+            logger.info("Applying output guardrails to response: '%.50s'", agent_response)
             output_result = self.engine.apply_output_guardrails(
                 agent_response, 
                 user_input,  # Pass original input for context
@@ -88,10 +118,12 @@ class GuardedAgent:
                 raise RuntimeError(error_msg)
             
             # Return the potentially modified output
-            final_response = output_result.content or agent_response
-            
+            final_response = output_result.modified_content
+            if final_response is None:
+                final_response = agent_response
+
             if output_result.modified_content:
-                logger.info(f"Output modified by guardrails: '{final_response[:50]}...'")
+                logger.info("Output modified by guardrails: '%.50s'", final_response)
             
             return final_response
             
@@ -101,9 +133,207 @@ class GuardedAgent:
                 raise
             else:
                 # Log and re-raise agent errors
-                logger.error(f"Agent error: {str(e)}")
+                logger.error("Agent error: %s", e)
                 raise RuntimeError(f"Agent execution failed: {str(e)}")
     
+    def chat_stream(self, user_input: str, **kwargs):
+        """
+        Stream a guarded response chunk by chunk.
+
+        Input guardrails run up front as usual; output guardrails run
+        incrementally on the response stream via the engine, so filtering
+        starts before the full response has arrived. Adapters without
+        native streaming fall back to a single chunk.
+
+        Args:
+            user_input: The user's input text
+            **kwargs: Additional arguments passed to the original agent
+
+        Yields:
+            str: Sanitized response chunks
+
+        Raises:
+            ValueError: If input is blocked by guardrails
+            RuntimeError: If output is blocked by guardrails
+        """
+        metadata = {
+            "kwargs": kwargs,
+            "agent_type": self._agent_type_name,
+            "original_agent_type": self._original_agent_type_name
+        }
+
+        # Apply input guardrails before the stream starts
+        if self.engine.input_guardrails:
+            input_result = self.engine.apply_input_guardrails(user_input, metadata)
+
+            if input_result.is_failure:
+                error_msg = f"Input blocked by guardrails: {input_result.message}"
+                logger.error(error_msg)
+                raise ValueError(error_msg)
+
+            processed_input = input_result.modified_content
+            if processed_input is None:
+                processed_input = user_input
+        else:
+            processed_input = user_input
+
+        # Raw agents reaching here via the adapter fast path may not
+        # stream; fall back to yielding the full response once
+        stream_fn = getattr(self.agent, 'chat_stream', None)
+        if stream_fn is not None:
+            chunks = stream_fn(processed_input, **kwargs)
+        else:
+            chunks = iter([self.agent.chat(processed_input, **kwargs)])
+
+        # With no output guardrails there is nothing to buffer for;
+        # pass the stream through untouched
+        if not self.engine.output_guardrails:
+            yield from chunks
+            return
+
+        yield from self.engine.apply_output_guardrails_stream(chunks, user_input, metadata)
+
+    def batch_chat(self, user_inputs: List[str], **kwargs) -> List[str]:
+        """
+        Chat with the agent for a whole batch of inputs.
+
+        Input and output guardrails run guardrail-major through the
+        engine's batch paths, so batch-aware guardrails amortize their
+        per-call overhead; agents exposing their own batch_chat get one
+        batched call instead of a Python loop of round trips.
+
+        Args:
+            user_inputs: The user input texts
+            **kwargs: Additional arguments passed to the original agent
+
+        Returns:
+            List of agent responses, one per input, in input order
+
+        Raises:
+            ValueError: If any input is blocked by guardrails
+            RuntimeError: If any output is blocked by guardrails
+        """
+        metadata = {
+            "kwargs": kwargs,
+            "agent_type": self._agent_type_name,
+            "original_agent_type": self._original_agent_type_name
+        }
+        metadata_list = [metadata] * len(user_inputs)
+
+        # Apply input guardrails across the batch
+        if self.engine.input_guardrails:
+            input_results = self.engine.apply_input_guardrails_batch(user_inputs, metadata_list)
+            for idx, result in enumerate(input_results):
+                if result.is_failure:
+                    error_msg = f"Input {idx} blocked by guardrails: {result.message}"
+                    logger.error(error_msg)
+                    raise ValueError(error_msg)
+            processed_inputs = [
+                result.modified_content if result.modified_content is not None else text
+                for text, result in zip(user_inputs, input_results)
+            ]
+        else:
+            processed_inputs = list(user_inputs)
+
+        # One batched agent call when the agent supports it; otherwise
+        # fall back to per-input calls through the adapter
+        batch_fn = getattr(self.agent, 'batch_chat', None)
+        if batch_fn is not None:
+            responses = list(batch_fn(processed_inputs, **kwargs))
+        else:
+            responses = [self.agent.chat(text, **kwargs) for text in processed_inputs]
+
+        # Apply output guardrails across the batch
+        if not self.engine.output_guardrails:
+            return responses
+
+        output_results = self.engine.apply_output_guardrails_batch(responses, user_inputs, metadata_list)
+        final_responses = []
+        for idx, (response, result) in enumerate(zip(responses, output_results)):
+            if result.is_failure:
+                error_msg = f"Output {idx} blocked by guardrails: {result.message}"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+            final_responses.append(
+                result.modified_content if result.modified_content is not None else response
+            )
+        return final_responses
+
+    async def achat(self, user_input: str, **kwargs) -> str:
+        """
+        Async variant of chat() that runs independent guardrails concurrently.
+
+        The agent call itself runs in a worker thread; input and output
+        guardrails go through the engine's async paths so pure validators
+        overlap instead of running back to back.
+
+        Args:
+            user_input: The user's input text
+            **kwargs: Additional arguments passed to the original agent
+
+        Returns:
+            str: The agent's response (potentially modified by output guardrails)
+
+        Raises:
+            ValueError: If input is blocked by guardrails
+            RuntimeError: If output is blocked by guardrails
+        """
+        metadata = {
+            "kwargs": kwargs,
+            "agent_type": self._agent_type_name,
+            "original_agent_type": self._original_agent_type_name
+        }
+
+        # Apply input guardrails; skip the engine round-trip entirely
+        # when none are registered
+        if self.engine.input_guardrails:
+            input_result = await self.engine.apply_input_guardrails_async(user_input, metadata)
+
+            if input_result.is_failure:
+                error_msg = f"Input blocked by guardrails: {input_result.message}"
+                logger.error(error_msg)
+                raise ValueError(error_msg)
+
+            # Use the potentially modified input
+            processed_input = input_result.modified_content
+            if processed_input is None:
+                processed_input = user_input
+        else:
+            processed_input = user_input
+
+        try:
+            # Call the agent through the adapter, off the event loop
+            agent_response = await asyncio.to_thread(self.agent.chat, processed_input, **kwargs)
+
+            # Apply output guardrails; with none registered the response
+            # goes back as-is
+            if not self.engine.output_guardrails:
+                return agent_response
+
+            output_result = await self.engine.apply_output_guardrails_async(
+                agent_response,
+                user_input,  # Pass original input for context
+                metadata
+            )
+
+            if output_result.is_failure:
+                error_msg = f"Output blocked by guardrails: {output_result.message}"
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+
+            # Return the potentially modified output
+            final_response = output_result.modified_content
+            return agent_response if final_response is None else final_response
+
+        except Exception as e:
+            if isinstance(e, (ValueError, RuntimeError)):
+                # Re-raise guardrail errors
+                raise
+            else:
+                # Log and re-raise agent errors
+                logger.error("Agent error: %s", e)
+                raise RuntimeError(f"Agent execution failed: {str(e)}")
+
     def get_guardrails_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the guardrails protecting this agent.
@@ -112,23 +342,20 @@ class GuardedAgent:
             Dictionary with guardrails statistics
         """
         stats = self.engine.get_stats()
-        stats["wrapped_agent_type"] = type(self.agent).__name__
+        stats["wrapped_agent_type"] = self._agent_type_name
         if hasattr(self.agent, 'agent'):
-            stats["original_agent_type"] = type(self.agent.agent).__name__
+            stats["original_agent_type"] = self._original_agent_type_name
         return stats
     
     def __getattr__(self, name: str) -> Any:
         """
         Delegate attribute access to the wrapped agent for other methods.
         
-        This allows the GuardedAgent to act as a transparent proxy for
-        methods other than 'chat'.
+        Public methods are bound directly in __init__, so this only
+        fires for attributes the agent resolves dynamically (or added
+        after wrapping); it keeps the wrapper a transparent proxy.
         """
-        if name == 'chat':
-            return self.chat
         return getattr(self.agent, name)
     
     def __str__(self) -> str:
-        adapter_type = type(self.agent).__name__
-        original_type = type(getattr(self.agent, 'agent', self.agent)).__name__
-        return f"GuardedAgent(adapter={adapter_type}, original_agent={original_type}, guardrails={self.engine})" 
\ No newline at end of file
+        return f"GuardedAgent(adapter={self._agent_type_name}, original_agent={self._original_agent_type_name}, guardrails={self.engine})" 
\ No newline at end of file
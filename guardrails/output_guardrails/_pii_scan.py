@@ -0,0 +1,189 @@
+"""
+Byte-level PII scanner for long outputs.
+
+For large agent responses the per-match Python overhead of the regex
+path (one dict per match, attribute calls per pattern) starts to
+dominate. This module walks the byte buffer once with a hand-rolled
+state machine covering the standard PII layouts — email, dashed/dotted
+phone, credit card, dashed SSN — and emits compact (type_id, start,
+end) tuples.
+
+When numba is installed the scanner is JIT-compiled (cache=True, so the
+compilation cost is paid once per machine); without numba the same
+functions run as plain Python, which is slower than the fused regex, so
+PIIFilterGuardrail only routes here when numba is actually available.
+"""
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# Type ids emitted by scan_bytes
+TYPE_EMAIL = 0
+TYPE_PHONE = 1
+TYPE_CREDIT_CARD = 2
+TYPE_SSN = 3
+
+
+@njit(cache=True)
+def _is_word(c):
+    """Regex \\w over ASCII bytes."""
+    return (48 <= c <= 57) or (65 <= c <= 90) or (97 <= c <= 122) or c == 95
+
+
+@njit(cache=True)
+def _is_digit(c):
+    return 48 <= c <= 57
+
+
+@njit(cache=True)
+def _is_local_char(c):
+    """Email local part: [A-Za-z0-9._%+-]"""
+    return (
+        _is_word(c) or c == 46 or c == 37 or c == 43 or c == 45
+    )
+
+
+@njit(cache=True)
+def _is_domain_char(c):
+    """Email domain: [A-Za-z0-9.-]"""
+    return (48 <= c <= 57) or (65 <= c <= 90) or (97 <= c <= 122) or c == 46 or c == 45
+
+
+@njit(cache=True)
+def _is_letter(c):
+    return (65 <= c <= 90) or (97 <= c <= 122)
+
+
+@njit(cache=True)
+def _digits_run(data, i, count):
+    """True if exactly `count` digit bytes start at i."""
+    if i + count > len(data):
+        return False
+    for j in range(i, i + count):
+        if not _is_digit(data[j]):
+            return False
+    return True
+
+
+@njit(cache=True)
+def _match_sep_groups(data, i, g1, sep, g2, g3):
+    """Match d{g1} sep d{g2} sep d{g3} at i; return end or -1."""
+    n = len(data)
+    if not _digits_run(data, i, g1):
+        return -1
+    p = i + g1
+    if p >= n or data[p] != sep:
+        return -1
+    p += 1
+    if not _digits_run(data, p, g2):
+        return -1
+    p += g2
+    if p >= n or data[p] != sep:
+        return -1
+    p += 1
+    if not _digits_run(data, p, g3):
+        return -1
+    return p + g3
+
+
+@njit(cache=True)
+def _match_credit_card(data, i):
+    """Match d{4}([- ]?d{4}){3} at i; return end or -1."""
+    n = len(data)
+    p = i
+    for block in range(4):
+        if not _digits_run(data, p, 4):
+            return -1
+        p += 4
+        if block < 3 and p < n and (data[p] == 45 or data[p] == 32):
+            # Optional separator, only consumed if digits follow
+            if _digits_run(data, p + 1, 4):
+                p += 1
+    return p
+
+
+@njit(cache=True)
+def _match_email(data, i):
+    """Match local@domain.tld at i; return end or -1."""
+    n = len(data)
+    p = i
+    while p < n and _is_local_char(data[p]):
+        p += 1
+    if p == i or p >= n or data[p] != 64:  # '@'
+        return -1
+    p += 1
+    d0 = p
+    while p < n and _is_domain_char(data[p]):
+        p += 1
+    if p == d0:
+        return -1
+    # The domain must end in .tld with at least two letters
+    letters = 0
+    q = p
+    while q > d0 and _is_letter(data[q - 1]):
+        letters += 1
+        q -= 1
+    if letters < 2 or q <= d0 or data[q - 1] != 46:  # '.'
+        return -1
+    return p
+
+
+@njit(cache=True)
+def scan_bytes(data, do_email, do_phone, do_cc, do_ssn):
+    """
+    Single pass over an ASCII byte buffer emitting PII spans.
+
+    Returns a list of (type_id, start, end) tuples. Match attempts
+    follow the same precedence as the fused regex (email, phone,
+    credit card, SSN) and resume after each match like finditer.
+    """
+    results = []
+    n = len(data)
+    i = 0
+    while i < n:
+        c = data[i]
+        if not _is_word(c) or (i > 0 and _is_word(data[i - 1])):
+            # Matches only start on a word boundary
+            i += 1
+            continue
+
+        end = -1
+        type_id = -1
+
+        if do_email:
+            end = _match_email(data, i)
+            if end != -1:
+                type_id = TYPE_EMAIL
+
+        if end == -1 and _is_digit(c):
+            if do_phone:
+                end = _match_sep_groups(data, i, 3, 45, 3, 4)  # '-'
+                if end == -1:
+                    end = _match_sep_groups(data, i, 3, 46, 3, 4)  # '.'
+                if end != -1:
+                    type_id = TYPE_PHONE
+            if end == -1 and do_cc:
+                end = _match_credit_card(data, i)
+                if end != -1:
+                    type_id = TYPE_CREDIT_CARD
+            if end == -1 and do_ssn:
+                end = _match_sep_groups(data, i, 3, 45, 2, 4)  # '-'
+                if end != -1:
+                    type_id = TYPE_SSN
+
+        # A trailing word character breaks the closing boundary
+        if end != -1 and (end >= n or not _is_word(data[end])):
+            results.append((type_id, i, end))
+            i = end
+        else:
+            i += 1
+
+    return results
@@ -2,11 +2,32 @@
 PII Filter Guardrail - Detects and masks personally identifiable information.
 """
 
-import re
+from collections import Counter
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
-from ..core.base import OutputGuardrail
+from . import _pii_scan
+from ..core.base import MultiPatternMatcher, OutputGuardrail
+from ..utils.checksums import luhn_ok
 from ..utils.result import GuardrailResult, GuardrailStatus
 
+# Outputs longer than this go through the compiled byte scanner when
+# numba is available; below it the fused regex wins
+FAST_SCAN_THRESHOLD = 10_000
+
+# Scanner type ids -> detection labels
+_FAST_SCAN_TYPES = {
+    _pii_scan.TYPE_EMAIL: ("email", "Email address"),
+    _pii_scan.TYPE_PHONE: ("phone", "Phone number"),
+    _pii_scan.TYPE_CREDIT_CARD: ("credit_card", "Credit card number"),
+    _pii_scan.TYPE_SSN: ("ssn", "Social Security Number"),
+}
+
+# Joins batched texts for a single fused scan. \x01 appears in no PII
+# pattern's character class, so no match can cross a text boundary;
+# doubled so boundary assertions (\b) see the same context on both
+# sides as they would at end-of-string
+_BATCH_SEPARATOR = "\x01\x01"
+
 
 class PIIFilterGuardrail(OutputGuardrail):
     """
@@ -29,6 +50,13 @@ class PIIFilterGuardrail(OutputGuardrail):
                 - mask_ssn: Whether to mask social security numbers (default: True)
                 - replacement: Replacement text for PII (default: "[REDACTED]")
                 - strict_mode: If True, block responses with PII instead of masking (default: False)
+                - validate_checksums: Whether to drop credit-card
+                  candidates that fail the Luhn checksum; card-shaped
+                  digit runs (timestamps, order ids) otherwise dominate
+                  the detections (default: True)
+                - allow_bare_digit_pii: Whether to match bare 9/10-digit runs
+                  as SSN/phone candidates; these fire on any numeric token,
+                  so they are off by default (default: False)
         """
         super().__init__(name, config)
         
@@ -39,99 +67,131 @@ class PIIFilterGuardrail(OutputGuardrail):
         self.mask_ssn = self.config.get("mask_ssn", True)
         self.replacement = self.config.get("replacement", "[REDACTED]")
         self.strict_mode = self.config.get("strict_mode", False)
+        self.validate_checksums = self.config.get("validate_checksums", True)
+        self.allow_bare_digit_pii = self.config.get("allow_bare_digit_pii", False)
+
+        # Masking rewrites the output, so the engine must run this
+        # guardrail serially unless it only blocks (strict mode)
+        self.mutates = not self.strict_mode
+
+        # Built-in guardrail: reports problems via results, never raises
+        self.trusted = True
         
-        # Regex patterns for PII detection
-        self.patterns = self._build_patterns()
-    
-    def _build_patterns(self) -> List[Tuple[str, re.Pattern, str]]:
-        """
-        Build regex patterns for PII detection.
-        
-        Returns:
-            List of tuples: (pii_type, compiled_pattern, description)
-        """
-        patterns = []
-        
-        if self.mask_emails:
-            # Email pattern
-            email_pattern = re.compile(
-                r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-                re.IGNORECASE
-            )
-            patterns.append(("email", email_pattern, "Email address"))
-        
-        if self.mask_phones:
-            # Phone number patterns (US format)
-            phone_patterns = [
-                re.compile(r'\b\d{3}-\d{3}-\d{4}\b'),  # 123-456-7890
-                re.compile(r'\b\(\d{3}\)\s*\d{3}-\d{4}\b'),  # (123) 456-7890
-                re.compile(r'\b\d{3}\.\d{3}\.\d{4}\b'),  # 123.456.7890
-                re.compile(r'\b\d{10}\b'),  # 1234567890
-            ]
-            for i, pattern in enumerate(phone_patterns):
-                patterns.append(("phone", pattern, f"Phone number (format {i+1})"))
-        
-        if self.mask_credit_cards:
-            # Credit card pattern (basic)
-            cc_pattern = re.compile(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b')
-            patterns.append(("credit_card", cc_pattern, "Credit card number"))
-        
-        if self.mask_ssn:
-            # Social Security Number patterns
-            ssn_patterns = [
-                re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),  # 123-45-6789
-                re.compile(r'\b\d{9}\b'),  # 123456789 (only if isolated)
-            ]
-            for i, pattern in enumerate(ssn_patterns):
-                patterns.append(("ssn", pattern, f"Social Security Number (format {i+1})"))
-        
-        return patterns
-    
-    def _detect_pii(self, text: str) -> List[Dict[str, Any]]:
+        # All enabled patterns fused into one single-pass matcher, so the
+        # text is scanned once instead of once per pattern; matchers are
+        # read-only, so instances with the same config share one
+        self._matcher, self._group_info = _build_matcher(
+            self.mask_emails, self.mask_phones,
+            self.mask_credit_cards, self.mask_ssn,
+            self.allow_bare_digit_pii
+        )
+
+        # The JIT byte scanner covers the standard layouts only; the
+        # bare-digit patterns stay on the regex path
+        self._fast_scan_ok = _pii_scan.HAVE_NUMBA and not self.allow_bare_digit_pii
+
+    def _detect_pii(self, text: str) -> List[Tuple[int, int, str, str]]:
         """
         Detect PII instances in the text.
-        
+
         Args:
             text: Text to analyze
-            
+
         Returns:
-            List of dictionaries with PII detection information
+            List of (start, end, pii_type, description) tuples ordered
+            by start position. Tuples keep the per-detection footprint
+            small and sort at C speed; filter() expands them to dicts
+            only for the result metadata.
         """
+        # Long ASCII outputs take the compiled single-pass byte scanner
+        # when numba is installed; spans come back ordered and
+        # non-overlapping, so no dedupe sweep is needed
+        if self._fast_scan_ok and len(text) > FAST_SCAN_THRESHOLD and text.isascii():
+            detections = []
+            spans = _pii_scan.scan_bytes(
+                text.encode('ascii'),
+                self.mask_emails, self.mask_phones,
+                self.mask_credit_cards, self.mask_ssn
+            )
+            for type_id, start, end in spans:
+                if (self.validate_checksums and type_id == _pii_scan.TYPE_CREDIT_CARD
+                        and not luhn_ok(text[start:end])):
+                    continue
+                pii_type, description = _FAST_SCAN_TYPES[type_id]
+                detections.append((start, end, pii_type, description))
+            return detections
+
         detections = []
-        
-        for pii_type, pattern, description in self.patterns:
-            matches = pattern.finditer(text)
-            for match in matches:
-                detections.append({
-                    "type": pii_type,
-                    "description": description,
-                    "text": match.group(),
-                    "start": match.start(),
-                    "end": match.end()
-                })
-        
+
+        # Interval sweep: sorted by (start, -end), a detection contained
+        # in the previous one is a duplicate of a broader match
+        prev_end = -1
+        matches = sorted(self._matcher.scan(text), key=lambda m: (m[1], -m[2]))
+        for group_name, start, end in matches:
+            if end <= prev_end:
+                continue
+            pii_type, description = self._group_info[group_name]
+            if (self.validate_checksums and pii_type == "credit_card"
+                    and not luhn_ok(text[start:end])):
+                # Card-shaped but the checksum says otherwise: a
+                # timestamp or order id, not a card number
+                continue
+            detections.append((start, end, pii_type, description))
+            prev_end = end
+
         return detections
     
-    def _mask_pii(self, text: str, detections: List[Dict[str, Any]]) -> str:
+    @staticmethod
+    def _spans_to_metadata(text: str, detections: List[Tuple[int, int, str, str]]) -> List[Dict[str, Any]]:
+        """
+        Expand detection spans into the dict shape reported in result
+        metadata.
+
+        Cold path: runs once per filtered response, so this is the only
+        place a dict per detection is allocated.
+
+        Args:
+            text: The text the spans were detected in
+            detections: List of (start, end, pii_type, description) tuples
+
+        Returns:
+            List of detection dictionaries
+        """
+        return [
+            {"type": pii_type, "description": description,
+             "text": text[start:end], "start": start, "end": end}
+            for start, end, pii_type, description in detections
+        ]
+
+    def _mask_pii(self, text: str, detections: List[Tuple[int, int, str, str]]) -> str:
         """
         Mask PII in the text.
         
         Args:
             text: Original text
-            detections: List of PII detections
+            detections: List of (start, end, pii_type, description) tuples
             
         Returns:
             Text with PII masked
         """
-        # Sort detections by position (reverse order to maintain indices)
-        sorted_detections = sorted(detections, key=lambda x: x["start"], reverse=True)
-        
-        masked_text = text
-        for detection in sorted_detections:
-            start, end = detection["start"], detection["end"]
-            masked_text = masked_text[:start] + self.replacement + masked_text[end:]
-        
-        return masked_text
+        # Single left-to-right pass: collect the slices between detections
+        # and join once, instead of reallocating the whole string per
+        # detection. _detect_pii emits in start order, so this keyless
+        # C-level sort is a near no-op safety net
+        detections.sort()
+
+        parts = []
+        last = 0
+        for start, end, _, _ in detections:
+            if start < last:
+                # Overlapping detection; already covered by the previous mask
+                continue
+            parts.append(text[last:start])
+            parts.append(self.replacement)
+            last = end
+        parts.append(text[last:])
+
+        return "".join(parts)
     
     def filter(self, output_text: str, input_text: str = "", metadata: Optional[Dict[str, Any]] = None) -> GuardrailResult:
         """
@@ -150,10 +210,104 @@ class PIIFilterGuardrail(OutputGuardrail):
                 status=GuardrailStatus.FAILED,
                 message="Output text is None"
             )
-        
+
+        if self.strict_mode:
+            # Blocking needs only the first hit, not every match in the
+            # text, so stop scanning as soon as one is found
+            hit = None
+            first = self._matcher.search(output_text)
+            if first is not None:
+                group_name, start, end = first
+                pii_type, description = self._group_info[group_name]
+                if (self.validate_checksums and pii_type == "credit_card"
+                        and not luhn_ok(output_text[start:end])):
+                    # The first hit failed its checksum; fall back to
+                    # the full scan, which drops invalid candidates
+                    detections = self._detect_pii(output_text)
+                    hit = detections[0] if detections else None
+                else:
+                    hit = (start, end, pii_type, description)
+            if hit is None:
+                return GuardrailResult(
+                    status=GuardrailStatus.PASSED,
+                    message="No PII detected in output",
+                    modified_content=output_text,
+                    metadata={"pii_detected": False, "pii_count": 0}
+                )
+            start, end, pii_type, description = hit
+            return GuardrailResult(
+                status=GuardrailStatus.BLOCKED,
+                message=f"Response blocked due to PII detection: {pii_type}",
+                metadata={
+                    "pii_detected": True,
+                    "pii_types": [pii_type],
+                    "detections": self._spans_to_metadata(
+                        output_text, [(start, end, pii_type, description)]
+                    ),
+                    # Scanning stopped at the first hit; later matches
+                    # are not enumerated
+                    "first_hit_only": True
+                }
+            )
+
         # Detect PII in the output
-        detections = self._detect_pii(output_text)
-        
+        return self._result_from_detections(output_text, self._detect_pii(output_text))
+
+    def filter_batch(self, texts: List[str], input_texts: Optional[List[str]] = None, metadata_list: Optional[List[Optional[Dict[str, Any]]]] = None) -> List[GuardrailResult]:
+        """
+        Filter a batch of output texts with one fused scan.
+
+        The texts are joined on a separator no pattern can match, scanned
+        once, and the detections split back per text by offset — one pass
+        through the regex engine instead of one per text. Strict mode
+        keeps the per-text path so its first-hit short circuit still
+        applies.
+
+        Args:
+            texts: The output texts to filter
+            input_texts: Optional per-text original inputs, aligned with texts
+            metadata_list: Optional per-text metadata, aligned with texts
+
+        Returns:
+            List of GuardrailResult, one per output text
+        """
+        if self.strict_mode or len(texts) < 2 or any(t is None for t in texts):
+            return super().filter_batch(texts, input_texts, metadata_list)
+
+        detections = self._detect_pii(_BATCH_SEPARATOR.join(texts))
+
+        # Detections come back in start order and never span a separator,
+        # so one forward walk buckets them back onto their source texts
+        results = []
+        base = 0
+        det_idx = 0
+        total = len(detections)
+        for text in texts:
+            limit = base + len(text)
+            local = []
+            while det_idx < total and detections[det_idx][0] < limit:
+                start, end, pii_type, description = detections[det_idx]
+                local.append((start - base, end - base, pii_type, description))
+                det_idx += 1
+            results.append(self._result_from_detections(text, local))
+            base = limit + len(_BATCH_SEPARATOR)
+        return results
+
+    def _result_from_detections(self, output_text: str, detections: List[Tuple[int, int, str, str]]) -> GuardrailResult:
+        """
+        Build the non-strict filter result for a text and its detections.
+
+        Shared tail of filter() and filter_batch(): summarizes, masks,
+        and packages the detections into a GuardrailResult.
+
+        Args:
+            output_text: The text the detections were found in
+            detections: List of (start, end, pii_type, description) tuples
+
+        Returns:
+            GuardrailResult: PASSED when detections is empty, WARNING
+            with masked content otherwise
+        """
         if not detections:
             # No PII detected
             return GuardrailResult(
@@ -163,38 +317,89 @@ class PIIFilterGuardrail(OutputGuardrail):
                 metadata={"pii_detected": False, "pii_count": 0}
             )
         
-        # PII detected
-        pii_types = list(set(d["type"] for d in detections))
-        pii_summary = {pii_type: len([d for d in detections if d["type"] == pii_type]) 
-                      for pii_type in pii_types}
-        
-        if self.strict_mode:
-            # Block the response entirely
-            return GuardrailResult(
-                status=GuardrailStatus.BLOCKED,
-                message=f"Response blocked due to PII detection: {', '.join(pii_types)}",
-                metadata={
-                    "pii_detected": True,
-                    "pii_count": len(detections),
-                    "pii_types": pii_types,
-                    "pii_summary": pii_summary,
-                    "detections": detections
-                }
-            )
-        else:
-            # Mask the PII
-            masked_text = self._mask_pii(output_text, detections)
-            
-            return GuardrailResult(
-                status=GuardrailStatus.WARNING,
-                message=f"PII masked in output: {len(detections)} instances of {', '.join(pii_types)}",
-                modified_content=masked_text,
-                metadata={
-                    "pii_detected": True,
-                    "pii_count": len(detections),
-                    "pii_types": pii_types,
-                    "pii_summary": pii_summary,
-                    "detections": detections,
-                    "masked": True
-                }
-            ) 
\ No newline at end of file
+        # PII detected: one pass over the detections for both the type
+        # list and the per-type counts
+        pii_summary = Counter(t[2] for t in detections)
+        pii_types = list(pii_summary)
+        pii_summary = dict(pii_summary)
+
+        # Dict view for result metadata only; the hot path stays on tuples
+        detection_dicts = self._spans_to_metadata(output_text, detections)
+
+        # Mask the PII
+        masked_text = self._mask_pii(output_text, detections)
+
+        return GuardrailResult(
+            status=GuardrailStatus.WARNING,
+            message=f"PII masked in output: {len(detections)} instances of {', '.join(pii_types)}",
+            modified_content=masked_text,
+            metadata={
+                "pii_detected": True,
+                "pii_count": len(detections),
+                "pii_types": pii_types,
+                "pii_summary": pii_summary,
+                "detections": detection_dicts,
+                "masked": True
+            }
+        )
+
+
+@lru_cache(maxsize=16)
+def _build_matcher(
+    mask_emails: bool,
+    mask_phones: bool,
+    mask_credit_cards: bool,
+    mask_ssn: bool,
+    allow_bare_digit_pii: bool,
+) -> Tuple[MultiPatternMatcher, Dict[str, Tuple[str, str]]]:
+    """
+    Build (and cache) the fused matcher for a pattern configuration.
+
+    Cached at module level so short-lived or multi-tenant setups that
+    construct many PIIFilterGuardrail instances with the same flags
+    share one compiled matcher instead of rebuilding it per instance.
+
+    Returns:
+        Tuple of (matcher, group_info): group_info maps the matcher's
+        group names -> (pii_type, description)
+    """
+    specs = []
+    group_info = {}
+
+    if mask_emails:
+        # Email pattern
+        specs.append(("email", r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'))
+        group_info["email"] = ("email", "Email address")
+
+    if mask_phones:
+        # Phone number patterns (US format); the bare 10-digit run
+        # matches any numeric token, so it is opt-in
+        phone_patterns = [
+            r'\b\d{3}-\d{3}-\d{4}\b',  # 123-456-7890
+            r'\b\(\d{3}\)\s*\d{3}-\d{4}\b',  # (123) 456-7890
+            r'\b\d{3}\.\d{3}\.\d{4}\b',  # 123.456.7890
+        ]
+        if allow_bare_digit_pii:
+            phone_patterns.append(r'\b\d{10}\b')  # 1234567890
+        for i, pattern in enumerate(phone_patterns):
+            specs.append((f"phone_{i+1}", pattern))
+            group_info[f"phone_{i+1}"] = ("phone", f"Phone number (format {i+1})")
+
+    if mask_credit_cards:
+        # Credit card pattern (basic)
+        specs.append(("credit_card", r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b'))
+        group_info["credit_card"] = ("credit_card", "Credit card number")
+
+    if mask_ssn:
+        # Social Security Number patterns; the bare 9-digit run is
+        # opt-in for the same reason as the bare phone pattern
+        ssn_patterns = [
+            r'\b\d{3}-\d{2}-\d{4}\b',  # 123-45-6789
+        ]
+        if allow_bare_digit_pii:
+            ssn_patterns.append(r'\b\d{9}\b')  # 123456789 (only if isolated)
+        for i, pattern in enumerate(ssn_patterns):
+            specs.append((f"ssn_{i+1}", pattern))
+            group_info[f"ssn_{i+1}"] = ("ssn", f"Social Security Number (format {i+1})")
+
+    return MultiPatternMatcher(specs), group_info
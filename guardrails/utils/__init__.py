@@ -2,6 +2,29 @@
 Utility classes and functions for the guardrails framework.
 """
 
+import importlib
+
 from .result import GuardrailStatus, GuardrailResult
 
-__all__ = ["GuardrailStatus", "GuardrailResult"] 
\ No newline at end of file
+__all__ = ["GuardrailStatus", "GuardrailResult", "luhn_ok", "aba_ok"]
+
+# Lazy re-exports (PEP 562), mirroring the package root: the checksum
+# helpers load on first use instead of at package-import time
+_EXPORTS = {
+    "luhn_ok": ".checksums",
+    "aba_ok": ".checksums",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        # Cache on the package so the next access skips this hook
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
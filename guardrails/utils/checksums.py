@@ -0,0 +1,66 @@
+"""
+Checksum validators for numeric PII candidates.
+
+Regexes for credit-card and bank-routing numbers match any digit run of
+the right shape, so most hits are false positives (timestamps, IDs,
+order numbers). Validating the checksum before emitting a detection
+keeps noise out of downstream filtering and spares the more expensive
+validation tiers.
+
+Candidates are 9-19 digit strings, so the loops run sub-microsecond in
+plain Python; JIT compilation buys nothing at this size (and would
+specialize per digit count), so the module stays dependency-free and
+cheap to import.
+"""
+
+from typing import Optional, Tuple
+
+# Luhn doubling table: 2*d with digits of the product summed
+_LUHN_DOUBLE = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+# ABA routing checksum weights, applied left to right over 9 digits
+_ABA_WEIGHTS = (3, 7, 1, 3, 7, 1, 3, 7, 1)
+
+
+def _extract_digits(candidate: str) -> Optional[Tuple[int, ...]]:
+    """Pull the digits out of a candidate, ignoring separators."""
+    digits = tuple(int(ch) for ch in candidate if ch.isdigit())
+    return digits or None
+
+
+def luhn_ok(candidate: str) -> bool:
+    """
+    Check a credit-card candidate against the Luhn checksum.
+
+    Args:
+        candidate: Matched text, possibly containing separators
+                   (e.g. "4111-1111-1111-1111")
+
+    Returns:
+        bool: True if the digits pass the Luhn check
+    """
+    digits = _extract_digits(candidate)
+    if digits is None or not 12 <= len(digits) <= 19:
+        return False
+    total = 0
+    double = False
+    for d in reversed(digits):
+        total += _LUHN_DOUBLE[d] if double else d
+        double = not double
+    return total % 10 == 0
+
+
+def aba_ok(candidate: str) -> bool:
+    """
+    Check a bank-routing-number candidate against the ABA checksum.
+
+    Args:
+        candidate: Matched text, possibly containing separators
+
+    Returns:
+        bool: True if the nine digits pass the ABA check
+    """
+    digits = _extract_digits(candidate)
+    if digits is None or len(digits) != 9:
+        return False
+    return sum(d * w for d, w in zip(digits, _ABA_WEIGHTS)) % 10 == 0
@@ -15,9 +15,20 @@ class GuardrailStatus(Enum):
     BLOCKED = "blocked"
 
 
-@dataclass
+# Statuses that count as a failure; built once so is_failure does a
+# set lookup instead of rebuilding a list on every access
+_FAILURE_STATES = frozenset({GuardrailStatus.FAILED, GuardrailStatus.BLOCKED})
+
+
+@dataclass(slots=True)
 class GuardrailResult:
-    """Result of a guardrail operation."""
+    """
+    Result of a guardrail operation.
+
+    Slotted: one result is allocated per guardrail per request, so the
+    smaller slot-backed layout cuts allocation and GC traffic on the
+    hot path.
+    """
     status: GuardrailStatus
     message: str
     modified_content: Optional[str] = None
@@ -32,12 +43,19 @@ class GuardrailResult:
     @property
     def is_failure(self) -> bool:
         """Check if the guardrail check failed."""
-        return self.status in [GuardrailStatus.FAILED, GuardrailStatus.BLOCKED]
+        return self.status in _FAILURE_STATES
     
     @property
-    def content(self) -> str:
-        """Get the content (modified if available, original otherwise)."""
-        return self.modified_content if self.modified_content is not None else ""
+    def content(self) -> Optional[str]:
+        """
+        Get the modified content, or None when the guardrail left the
+        text untouched.
+
+        Returning None instead of "" lets callers distinguish "no
+        modification" from "modified to empty" with a single identity
+        check rather than a truthiness dance against the original text.
+        """
+        return self.modified_content
     
     def __str__(self) -> str:
         return f"GuardrailResult(status={self.status.value}, message='{self.message}')" 
\ No newline at end of file
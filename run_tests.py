@@ -2,29 +2,34 @@
 """
 Test Runner for Trustwise Guardrails Framework
 
-This script runs all tests in the tests/ directory.
+This script runs all tests in the tests/ directory. Test modules are
+imported and run in this interpreter rather than spawned as
+subprocesses, so the interpreter start-up and heavy client imports
+(boto3, openai, langchain) are paid once for the whole suite instead
+of once per test file.
 """
 
+import importlib
 import sys
-import os
-import subprocess
 from pathlib import Path
 
 
-def run_test(test_file: str, description: str) -> bool:
-    """Run a single test file and return success status."""
+def run_test(module_name: str, entry_point: str, description: str) -> bool:
+    """Import a test module and run its entry function; return success status."""
     print(f"\n{'='*60}")
     print(f"🧪 {description}")
     print(f"{'='*60}")
-    
+
     try:
-        result = subprocess.run([sys.executable, test_file], 
-                              capture_output=False, 
-                              check=True)
+        module = importlib.import_module(module_name)
+        getattr(module, entry_point)()
         print(f"✅ {description} - PASSED")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} - FAILED (exit code: {e.returncode})")
+    except SystemExit as e:
+        if e.code in (0, None):
+            print(f"✅ {description} - PASSED")
+            return True
+        print(f"❌ {description} - FAILED (exit code: {e.code})")
         return False
     except Exception as e:
         print(f"❌ {description} - ERROR: {e}")
@@ -35,30 +40,30 @@ def main():
     """Run all tests."""
     print("🚀 TRUSTWISE GUARDRAILS - TEST SUITE")
     print("=" * 60)
-    
-    # Define tests to run
+
+    # Make the tests/ modules importable regardless of where the runner
+    # is invoked from
+    sys.path.insert(0, str(Path(__file__).parent))
+
+    # Define tests to run: (module, entry function, description)
     tests = [
-        ("tests/test_guardrails.py", "Core Guardrails Framework Tests"),
-        ("tests/test_adapters.py", "Agent Adapter System Tests"),
-        ("tests/test_agent_openai.py", "OpenAI Agent Tests"),
-        ("tests/test_agent.py", "AWS Bedrock Agent Tests"),
+        ("tests.test_guardrails", "main", "Core Guardrails Framework Tests"),
+        ("tests.test_adapters", "main", "Agent Adapter System Tests"),
+        ("tests.test_agent_openai", "test_agent", "OpenAI Agent Tests"),
+        ("tests.test_agent", "test_agent", "AWS Bedrock Agent Tests"),
     ]
-    
+
     # Track results
     passed = 0
     failed = 0
-    
+
     # Run each test
-    for test_file, description in tests:
-        if os.path.exists(test_file):
-            if run_test(test_file, description):
-                passed += 1
-            else:
-                failed += 1
+    for module_name, entry_point, description in tests:
+        if run_test(module_name, entry_point, description):
+            passed += 1
         else:
-            print(f"⚠️  Test file not found: {test_file}")
             failed += 1
-    
+
     # Summary
     total = passed + failed
     print(f"\n{'='*60}")
@@ -67,7 +72,7 @@ def main():
     print(f"Total Tests: {total}")
     print(f"✅ Passed: {passed}")
     print(f"❌ Failed: {failed}")
-    
+
     if failed == 0:
         print(f"\n🎉 All tests passed!")
         return 0
@@ -77,4 +82,4 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main())
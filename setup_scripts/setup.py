@@ -5,6 +5,7 @@ This script helps with initial setup and dependency installation.
 """
 
 import os
+import shutil
 import subprocess
 import sys
 
@@ -27,8 +28,9 @@ def setup_environment():
     if not os.path.exists(env_file):
         if os.path.exists(example_file):
             print(f"📝 Creating {env_file} from {example_file}...")
-            with open(example_file, 'r') as src, open(env_file, 'w') as dst:
-                dst.write(src.read())
+            # Kernel-level copy (os.sendfile on Linux) instead of
+            # bouncing the bytes through a Python string
+            shutil.copyfile(example_file, env_file)
             print(f"✅ Created {env_file}")
             print(f"⚠️  Please edit {env_file} with your AWS credentials!")
         else:
@@ -27,7 +27,11 @@ def test_agent():
         test_query = "Hello! Can you tell me a short joke?"
         print(f"\n📝 Test query: {test_query}")
         
-        # Get response
+        # Get response; GUARDRAILS_DRYRUN skips the live (billable) model
+        # call so the suite stays fast offline — reserve real calls for a
+        # nightly job
+        if os.getenv("GUARDRAILS_DRYRUN"):
+            agent.chat = lambda q, **_: "Dry run: stubbed response"
         print("🤔 Processing...")
         response = agent.chat(test_query)
         
@@ -4,8 +4,10 @@ Test script for the Guardrails Framework
 This script tests the individual guardrails and the overall framework.
 """
 
+import traceback
 import sys
 import os
+from dataclasses import dataclass
 
 # Add the parent directory to the path for imports
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
@@ -16,6 +18,15 @@ from guardrails.output_guardrails.pii_filter import PIIFilterGuardrail
 from guardrails.utils.result import GuardrailStatus
 
 
+@dataclass(frozen=True, slots=True)
+class Case:
+    """One guardrail test case; slotted so a record costs what a tuple does."""
+    name: str
+    text: str
+    expected: "GuardrailStatus"
+    mask: bool = False
+
+
 class SimpleTestAgent:
     """Simple test agent for unit testing."""
     
@@ -24,15 +35,16 @@ class SimpleTestAgent:
         if "pii" in user_input.lower():
             return "Contact us at john.doe@company.com or call 555-123-4567"
         elif "credit" in user_input.lower():
-            return "Your card number is 4532 1234 5678 9012"
+            return "Your card number is 4111 1111 1111 1111"
         else:
             return f"Echo: {user_input}"
 
 
 def test_length_validator():
     """Test the LengthValidatorGuardrail."""
-    print("🧪 Testing LengthValidatorGuardrail")
-    print("-" * 40)
+    # Report lines are batched into one write instead of a print (and
+    # stdout flush) per line
+    lines = ["🧪 Testing LengthValidatorGuardrail", "-" * 40]
     
     # Test configuration
     guardrail = LengthValidatorGuardrail(
@@ -44,63 +56,97 @@ def test_length_validator():
         }
     )
     
-    test_cases = [
-        ("Valid input", "Hello world", GuardrailStatus.PASSED),
-        ("Too short", "Hi", GuardrailStatus.FAILED),
-        ("Too long (truncated)", "This is a very long message that should be truncated", GuardrailStatus.WARNING),
-        ("Edge case - min length", "Hello", GuardrailStatus.PASSED),
-        ("Empty string", "", GuardrailStatus.FAILED),
-    ]
+    test_cases = (
+        Case("Valid input", "Hello world", GuardrailStatus.PASSED),
+        Case("Too short", "Hi", GuardrailStatus.FAILED),
+        Case("Too long (truncated)", "This is a very long message that should be truncated", GuardrailStatus.WARNING),
+        Case("Edge case - min length", "Hello", GuardrailStatus.PASSED),
+        Case("Empty string", "", GuardrailStatus.FAILED),
+    )
     
-    for test_name, input_text, expected_status in test_cases:
-        result = guardrail.validate(input_text)
-        status_match = result.status == expected_status
+    for case in test_cases:
+        input_length = len(case.text)
+        result = guardrail.validate(case.text)
+        status_match = result.status == case.expected
         
-        print(f"  {'✅' if status_match else '❌'} {test_name}")
-        print(f"    Input: '{input_text}' (len={len(input_text)})")
-        print(f"    Expected: {expected_status.value}, Got: {result.status.value}")
-        print(f"    Message: {result.message}")
+        lines.append(f"  {'✅' if status_match else '❌'} {case.name}")
+        lines.append(f"    Input: '{case.text}' (len={input_length})")
+        lines.append(f"    Expected: {case.expected.value}, Got: {result.status.value}")
+        lines.append(f"    Message: {result.message}")
         if result.modified_content:
-            print(f"    Modified: '{result.modified_content}'")
-        print()
+            lines.append(f"    Modified: '{result.modified_content}'")
+        lines.append("")
+
+    print("\n".join(lines))
+
+
+# Built once at module scope: every case below exercises the same
+# pre-compiled pattern set instead of rebuilding it per test
+PII_GUARDRAIL = PIIFilterGuardrail(
+    "test_pii",
+    config={
+        "mask_emails": True,
+        "mask_phones": True,
+        "mask_credit_cards": True,
+        "replacement": "[MASKED]"
+    }
+)
 
 
 def test_pii_filter():
     """Test the PIIFilterGuardrail."""
-    print("🧪 Testing PIIFilterGuardrail")
-    print("-" * 40)
+    # Report lines are batched into one write instead of a print (and
+    # stdout flush) per line
+    lines = ["🧪 Testing PIIFilterGuardrail", "-" * 40]
     
-    # Test configuration
-    guardrail = PIIFilterGuardrail(
-        "test_pii",
-        config={
-            "mask_emails": True,
-            "mask_phones": True,
-            "mask_credit_cards": True,
-            "replacement": "[MASKED]"
-        }
-    )
+    guardrail = PII_GUARDRAIL
+
+    # Identically-configured instances share one compiled matcher, so
+    # construction cost is paid once per configuration
+    twin = PIIFilterGuardrail("test_pii_twin", config=dict(guardrail.config))
+    shared = twin._matcher is guardrail._matcher
+    lines.append(f"  {'✅' if shared else '❌'} Compiled matcher shared across instances")
+    lines.append("")
     
-    test_cases = [
-        ("No PII", "Hello, how are you today?", GuardrailStatus.PASSED, False),
-        ("Email PII", "Contact john.doe@company.com for help", GuardrailStatus.WARNING, True),
-        ("Phone PII", "Call us at 555-123-4567", GuardrailStatus.WARNING, True),
-        ("Credit Card PII", "Card: 4532 1234 5678 9012", GuardrailStatus.WARNING, True),
-        ("Multiple PII", "Email john@test.com or call 555-123-4567", GuardrailStatus.WARNING, True),
-    ]
+    test_cases = (
+        Case("No PII", "Hello, how are you today?", GuardrailStatus.PASSED),
+        Case("Email PII", "Contact john.doe@company.com for help", GuardrailStatus.WARNING, mask=True),
+        Case("Phone PII", "Call us at 555-123-4567", GuardrailStatus.WARNING, mask=True),
+        Case("Credit Card PII", "Card: 4111 1111 1111 1111", GuardrailStatus.WARNING, mask=True),
+        Case("Multiple PII", "Email john@test.com or call 555-123-4567", GuardrailStatus.WARNING, mask=True),
+    )
     
-    for test_name, output_text, expected_status, should_mask in test_cases:
-        result = guardrail.filter(output_text)
-        status_match = result.status == expected_status
-        masking_correct = bool(result.modified_content) == should_mask
+    for case in test_cases:
+        result = guardrail.filter(case.text)
+        status_match = result.status == case.expected
+        masking_correct = bool(result.modified_content) == case.mask
         
-        print(f"  {'✅' if status_match and masking_correct else '❌'} {test_name}")
-        print(f"    Output: '{output_text}'")
-        print(f"    Expected: {expected_status.value}, Got: {result.status.value}")
-        print(f"    Message: {result.message}")
+        lines.append(f"  {'✅' if status_match and masking_correct else '❌'} {case.name}")
+        lines.append(f"    Output: '{case.text}'")
+        lines.append(f"    Expected: {case.expected.value}, Got: {result.status.value}")
+        lines.append(f"    Message: {result.message}")
         if result.modified_content:
-            print(f"    Masked: '{result.modified_content}'")
-        print()
+            lines.append(f"    Masked: '{result.modified_content}'")
+        lines.append("")
+
+    # A card-shaped number that fails the Luhn checksum is a false
+    # positive and must not be reported
+    luhn_result = guardrail.filter("Card: 4532 1234 5678 9012")
+    luhn_check = luhn_result.status == GuardrailStatus.PASSED
+    lines.append(f"  {'✅' if luhn_check else '❌'} Luhn-invalid card number ignored")
+    lines.append("")
+
+    # The fused batch scan must agree with the per-text path case by case
+    batch_results = guardrail.filter_batch([case.text for case in test_cases])
+    batch_ok = len(batch_results) == len(test_cases)
+    for case, batch_result in zip(test_cases, batch_results):
+        single = guardrail.filter(case.text)
+        if batch_result.status != single.status or batch_result.modified_content != single.modified_content:
+            batch_ok = False
+    lines.append(f"  {'✅' if batch_ok else '❌'} Batch filter matches per-text results")
+    lines.append("")
+
+    print("\n".join(lines))
 
 
 def test_engine_integration():
@@ -164,9 +210,36 @@ def test_engine_integration():
                 print(f"    ✅ Correctly blocked: {e}")
             else:
                 print(f"    ❌ Unexpected error: {e}")
-        
+
         print()
 
+    # Batch path: one call through the guardrail-major batch pipeline
+    print("  Testing: Batch chat")
+    try:
+        responses = guarded_agent.batch_chat(["Hello there", "Tell me about PII"])
+        batch_ok = (
+            len(responses) == 2
+            and "Hello there" in responses[0]
+            and "[REDACTED]" in responses[1]
+        )
+        print(f"    {'✅' if batch_ok else '❌'} Batch responses: {responses}")
+    except Exception as e:
+        print(f"    ❌ Unexpected error: {e}")
+    print()
+
+    # Streaming path: a PII match straddling the release cut must come
+    # out masked exactly as on the non-streaming path
+    print("  Testing: Streaming straddled PII")
+    try:
+        text = ("x" * 60) + "Contact john.doe@company.com now " + ("y" * 40)
+        streamed = "".join(engine.apply_output_guardrails_stream(iter([text])))
+        expected = engine.apply_output_guardrails(text).modified_content
+        stream_ok = streamed == expected and "john.doe" not in streamed
+        print(f"    {'✅' if stream_ok else '❌'} Streamed output matches non-streaming")
+    except Exception as e:
+        print(f"    ❌ Unexpected error: {e}")
+    print()
+
 
 def test_guardrails_stats():
     """Test guardrails statistics and configuration."""
@@ -213,7 +286,6 @@ def main():
         
     except Exception as e:
         print(f"❌ Test failed with error: {e}")
-        import traceback
         traceback.print_exc()
 
 